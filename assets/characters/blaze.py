@@ -6,25 +6,27 @@ ROOT_PATH = os.getenv("ROOT_PATH")
 sys.path.append(ROOT_PATH)
 
 from scripts.character import Character
-from scripts.animation import Animation
+from scripts.animation import AnimationDescriptor
 
 class Blaze(Character):
 
+  NAME = "Blaze"
+  STATS = {"speed": 5, "health": 100, "strength": 5, "agility": 10, "intelligence": 10, "charisma": 10}
+  SIZE = 2
+  ANIMATIONS = {
+    "idle": AnimationDescriptor("./assets/sprites/blaze/idle.png", "./assets/animations/blaze/idle.json", use_velocity=False, loop=True),
+    "walk": AnimationDescriptor("./assets/sprites/blaze/walk.png", "./assets/animations/blaze/walk.json", use_velocity=True, loop=True),
+    "run": AnimationDescriptor("./assets/sprites/blaze/walk.png", "./assets/animations/blaze/run.json", use_velocity=True, loop=True),
+  }
+  # Estados que costumam vir em seguida e são carregados em segundo plano
+  PREFETCH = {"idle": ["walk"], "walk": ["run"]}
+
   def __init__(self, x=0, y=0, max_y=260, min_y=10):
-    self.name = "Rollerblader"
-    self.speed = 5
-    self.health = 100
-    self.strength = 5
-    self.agility = 10
-    self.intelligence = 10
-    self.charisma = 10
-    self.size = 2
-    animations = {
-      "idle": Animation("./assets/sprites/blaze/idle.png", "./assets/animations/blaze/idle.json", use_velocity=False, loop=True),
-      "walk": Animation("./assets/sprites/blaze/walk.png", "./assets/animations/blaze/walk.json", use_velocity=True, loop=True),
-      "run": Animation("./assets/sprites/blaze/walk.png", "./assets/animations/blaze/run.json", use_velocity=True, loop=True),
-    }
-    super().__init__(x, y, width=self.size, height=self.size, animations=animations, use_gravity=False, min_y=min_y, max_y=max_y, speed=self.speed)
+    self.name = self.NAME
+    for stat, value in self.STATS.items():
+      setattr(self, stat, value)
+    self.size = self.SIZE
+    super().__init__(x, y, width=self.size, height=self.size, animations=self.ANIMATIONS, use_gravity=False, min_y=min_y, max_y=max_y, speed=self.speed, animation_prefetch=self.PREFETCH)
 
   def move(self, dx, dy):
       """Move o personagem no chão e permite movimentação limitada no eixo Y."""
@@ -5,28 +5,30 @@ ROOT_PATH = os.getenv("ROOT_PATH")
 sys.path.append(ROOT_PATH)
 
 from scripts.character import Character
-from scripts.animation import Animation
+from scripts.animation import AnimationDescriptor
 
 class Rollerblader(Character):
 
+  NAME = "Rollerblader"
+  STATS = {"speed": 7, "health": 100, "strength": 5, "agility": 10, "intelligence": 5, "charisma": 10}
+  SIZE = 2.2
+  ANIMATIONS = {
+    "idle": AnimationDescriptor("./assets/sprites/rollerblader/idle.png", "./assets/animations/rollerblader/idle.json", use_velocity=False, loop=True),
+    "walk": AnimationDescriptor("./assets/sprites/rollerblader/walk.png", "./assets/animations/rollerblader/walk.json", use_velocity=True, loop=True),
+    "run": AnimationDescriptor("./assets/sprites/rollerblader/run.png", "./assets/animations/rollerblader/run.json", use_velocity=True, loop=True),
+    "jump": AnimationDescriptor("./assets/sprites/rollerblader/jump.png", "./assets/animations/rollerblader/jump.json", use_velocity=False),
+    "dodge": AnimationDescriptor("./assets/sprites/rollerblader/dodge.png", "./assets/animations/rollerblader/dodge.json", use_velocity=False),
+    "fall": AnimationDescriptor("./assets/sprites/rollerblader/fall.png", "./assets/animations/rollerblader/fall.json", use_velocity=True, loop=True),
+  }
+  # Estados que costumam vir em seguida e são carregados em segundo plano
+  PREFETCH = {"idle": ["walk"], "walk": ["run"], "run": ["jump"], "jump": ["fall"]}
+
   def __init__(self, x=0, y=0, max_y=260, min_y=10):
-    self.name = "Rollerblader"
-    self.speed = 7
-    self.health = 100
-    self.strength = 5
-    self.agility = 10
-    self.intelligence = 5
-    self.charisma = 10
-    self.size = 2.2
-    animations = {
-      "idle": Animation("./assets/sprites/rollerblader/idle.png", "./assets/animations/rollerblader/idle.json", use_velocity=False, loop=True),
-      "walk": Animation("./assets/sprites/rollerblader/walk.png", "./assets/animations/rollerblader/walk.json", use_velocity=True, loop=True),
-      "run": Animation("./assets/sprites/rollerblader/run.png", "./assets/animations/rollerblader/run.json", use_velocity=True, loop=True),
-      "jump": Animation("./assets/sprites/rollerblader/jump.png", "./assets/animations/rollerblader/jump.json", use_velocity=False),
-      "dodge": Animation("./assets/sprites/rollerblader/dodge.png", "./assets/animations/rollerblader/dodge.json", use_velocity=False),
-      "fall": Animation("./assets/sprites/rollerblader/fall.png", "./assets/animations/rollerblader/fall.json", use_velocity=True, loop=True),
-    }
-    super().__init__(x, y, width=self.size, height=self.size, animations=animations, use_gravity=False, min_y=min_y, max_y=max_y, speed=self.speed)
+    self.name = self.NAME
+    for stat, value in self.STATS.items():
+      setattr(self, stat, value)
+    self.size = self.SIZE
+    super().__init__(x, y, width=self.size, height=self.size, animations=self.ANIMATIONS, use_gravity=False, min_y=min_y, max_y=max_y, speed=self.speed, animation_prefetch=self.PREFETCH)
 
   def update(self, params):
     super().update(params)
@@ -5,9 +5,21 @@ sys.path.append(os.getenv("ROOT_PATH"))
 ROOT_PATH = os.getenv("ROOT_PATH")
 from scripts.animation import Animation
 from scripts.car import Car
+from scripts.component_store import Column
+from scripts.game_log import get_logger
+
+import pygame
+
+log = get_logger(__name__)
 
 class Jeep(Car):
-    def __init__(self, x, y, width=0, height=0, use_gravity=False, use_collision=False):
+    VECTORIZED = True  # Gravidade, parallax, movimento e tempo de vida rodam em ComponentStore.step
+    LIFETIME = 300  # Tempo de vida em frames (5 segundos a 60 FPS)
+
+    lifetime = Column("lifetime")
+    current_lifetime = Column("age")
+
+    def __init__(self, x, y, width=0, height=0, use_gravity=False, use_collision=False, pixel_perfect=True):
         """
         Classe para jipes que herdam de Car.
 
@@ -17,14 +29,28 @@ class Jeep(Car):
         :param height: Altura do objeto (usado para colisão)
         :param use_gravity: Define se o objeto será afetado pela gravidade
         :param use_collision: Define se o objeto terá colisão ativa
+        :param pixel_perfect: Com `use_collision`, colisão pelos pixels do sprite (o jipe ocupa bem menos que a caixa)
         """
         animations = {
             "idle": Animation("./assets/sprites/jeep/jeep_drive.png", "./assets/animations/jeep/jeep_drive.json", use_velocity=False, loop=True),
         }
-        super().__init__(x, y, animations, width, height, use_gravity, use_collision)
+        super().__init__(x, y, animations, width, height, use_gravity, use_collision, pixel_perfect)
         self.velocity_x = -2  # Velocidade horizontal predeterminada
-        self.lifetime = 300  # Tempo de vida em frames (5 segundos a 60 FPS)
+        self.lifetime = self.LIFETIME
         self.current_lifetime = 0  # Contador de tempo de vida
+        self.on_destroy = None  # Chamado por destroy(), ex.: MainScene.despawn_jeep para devolver ao pool
+
+    def reset(self, x, y, velocity_x=-2):
+        """Prepara um jipe reaproveitado (ObjectPool) para um novo spawn, como se fosse recém-criado."""
+        self.x = self.previous_x = x
+        self.y = self.previous_y = y
+        self.velocity_x = velocity_x
+        self.lifetime = self.LIFETIME
+        self.current_lifetime = 0
+        if self.gravity_component:
+            self.gravity_component.reset_velocity()
+        self.animation_handler.current_animation.reset()
+        self.drawn_rect = pygame.Rect(0, 0, 0, 0)
 
     def update(self, params):
         """
@@ -40,7 +66,9 @@ class Jeep(Car):
 
     def destroy(self):
         """
-        Remove o jipe da cena.
+        Remove o jipe da cena, avisando quem o criou por `on_destroy`.
         """
-        # Aqui você pode adicionar lógica para remover o objeto da lista de objetos do jogo
-        print("Jeep destroyed!")
\ No newline at end of file
+        on_destroy, self.on_destroy = self.on_destroy, None  # Só uma vez, mesmo que o tempo de vida continue esgotado
+        if on_destroy is not None:
+            on_destroy(self)
+            log.debug("Jeep destroyed!")
\ No newline at end of file
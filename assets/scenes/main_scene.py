@@ -6,13 +6,32 @@ from assets.objects.jeep import Jeep  # Import the Jeep class
 
 sys.path.append(os.getenv("ROOT_PATH"))
 from scripts.game_scene import GameScene
+from scripts.render_queue import RenderQueue
+from scripts.object_pool import ObjectPool
+from scripts.tracing import traced
 from assets.objects.ground import Ground
-from assets.characters.rollerblader import Rollerblader
+from scripts.character_registry import character_registry
+from scripts.settings_store import settings
+from scripts.game_log import get_logger
+
+log = get_logger(__name__)
 
 class MainScene(GameScene):
     """Cena principal do jogo com chão, personagem e jipes."""
-    def __init__(self, screen):
+    REPORTS_DAMAGE = True  # Com o fundo parado, só as áreas dos objetos são enviadas ao display
+    MAX_JEEPS = 8  # Teto do pool de jipes: nunca existem mais que isso, não importa a duração da sessão
+    JEEP_SIZE = (205, 79)  # Tamanho desenhado do jipe, também usado pela colisão por pixel
+    JEEP_RECYCLE_MARGIN = 150  # Distância além da borda da tela em que um jipe que está saindo é reciclado
+    DEFAULT_CHARACTER = "ROLLERBLADER"  # Jogado quando nenhum personagem foi escolhido
+
+    def __init__(self, screen, assets=None, max_jeeps=None):
+        """
+        :param screen: Superfície onde a cena será desenhada.
+        :param assets: Assets já carregados por um SceneLoader (veja `preload_assets`). O que faltar é carregado aqui.
+        :param max_jeeps: Teto do pool de jipes (padrão: MAX_JEEPS).
+        """
         super().__init__(screen)
+        assets = dict(assets or {})
 
         # Criando o chão
         self.ground_y = 700  # Define a posição correta do chão
@@ -21,27 +40,49 @@ class MainScene(GameScene):
 
         # Carregando os backgrounds
         root_path = os.getenv("ROOT_PATH")
+        if "background-1" not in assets:
+            assets["background-1"] = self.load_and_scale_background(os.path.join(root_path, "assets", "sprites", "street", "background-1.png"), self.screen.get_size())
         self.main_backgrounds = [
-            self.load_and_scale_background(os.path.join(root_path, "assets", "sprites", "street", "background-1.png"))
-            # self.load_and_scale_background(os.path.join(root_path, "assets", "sprites", "street", "background-2.png"))
+            assets["background-1"]
+            # self.load_and_scale_background(os.path.join(root_path, "assets", "sprites", "street", "background-2.png"), self.screen.get_size())
         ]
         self.background = [{"image": self.main_backgrounds[0], "x": 0, "y": 0}]
+        self.scroll_step = 0  # Deslocamento do fundo no último passo, usado para interpolar o desenho
+        self.drawn_background = None  # Posições do fundo no último desenho
 
         self.bg_width = self.main_backgrounds[0].get_width()  # Pegamos a largura do primeiro fundo
 
         for bg in self.main_backgrounds:
-            print(bg.get_width(), bg.get_height())  # Isso imprime o tamanho de cada fundo
+            log.debug("Fundo: %dx%d", bg.get_width(), bg.get_height())
 
         self.player = None
+        self.preloaded_player = assets.get("player")  # Personagem salvo, criado pelo SceneLoader
 
         # Jeep spawning logic
-        self.jeeps = []  # Lista de jipes ativos
+        max_jeeps = self.MAX_JEEPS if max_jeeps is None else max_jeeps
+        self.jeep_pool = ObjectPool(lambda: Jeep(0, self.ground_y - 50, *self.JEEP_SIZE, use_collision=True), max_jeeps, prefill=max_jeeps)
+        self.jeeps = {}  # Jipes ativos (dicionário para remoção O(1))
         self.last_spawn_time = 0  # Tempo do último spawn
         self.spawn_interval = randint(2, 5)  # Intervalo inicial entre spawns (em segundos)
 
-    def load_and_scale_background(self, image_path):
+    @classmethod
+    def preload_assets(cls, screen_size):
+        """Assets que um SceneLoader pode carregar em segundo plano antes de criar a cena."""
+        root_path = os.getenv("ROOT_PATH")
+        return {
+            "background-1": lambda: cls.load_and_scale_background(os.path.join(root_path, "assets", "sprites", "street", "background-1.png"), screen_size),
+            "player": cls.create_player,
+        }
+
+    @classmethod
+    def create_player(cls):
+        """Cria só o personagem salvo em settings.json; o padrão só quando nenhum foi escolhido."""
+        return character_registry.create(settings.get("selected_character") or cls.DEFAULT_CHARACTER)
+
+    @staticmethod
+    def load_and_scale_background(image_path, screen_size):
         """Carrega e reescala o background para que sua altura preencha a tela sem deformação."""
-        screen_width, screen_height = self.screen.get_size()
+        screen_width, screen_height = screen_size
         original_image = pygame.image.load(image_path)
 
         # Obtém dimensões originais
@@ -59,33 +100,35 @@ class MainScene(GameScene):
         
         return scaled_image
 
+    @traced()
     def update(self, params):
         """Atualiza a cena, personagem e spawn de jipes."""
         if params["selected_character"] is None and self.player is None:
-            self.player = Rollerblader()
+            self.player = self.preloaded_player or self.create_player()
             player_x = 300
             player_y = self.ground_y - self.player.height  # Usa a altura do personagem
             params["main_update"]({"selected_character": self.player})
-            print(f"🎮 Adicionando personagem na posição ({player_x}, {player_y})")
+            log.info("🎮 Adicionando personagem na posição (%s, %s)", player_x, player_y)
             self.player.set_position(player_x, player_y)
             self.add_object(self.player)
         if params["selected_character"] and self.player is None:
             self.player = params["selected_character"]
             player_x = 300
             player_y = self.ground_y - self.player.height  # Usa a altura do personagem
-            print(f"🎮 Adicionando personagem na posição ({player_x}, {player_y})")
+            log.info("🎮 Adicionando personagem na posição (%s, %s)", player_x, player_y)
             self.player.set_position(player_x, player_y)
             self.add_object(self.player)
 
         # Atualiza o spawn de jipes
         # self.spawn_jeeps(params.get("dt", 0))
 
-        # Atualiza todos os jipes ativos
-        for jeep in self.jeeps:
-            jeep.update(params)
-
+        # Os jipes estão em self.objects: super() os move em lote (veja GameScene.update)
         super().update(params)
+        self.recycle_offscreen_jeeps()
+
+        self.update_background()
 
+    @traced()
     def spawn_jeeps(self, dt):
         """Lógica para spawnar jipes fora da visão do jogador."""
         self.last_spawn_time += dt
@@ -107,17 +150,37 @@ class MainScene(GameScene):
                 x = screen_width + 100  # Fora da tela à direita
                 velocity_x = uniform(-5, -2)  # Velocidade negativa (movendo para a esquerda)
 
-            # Cria o jipe
-            jeep = Jeep(x, self.ground_y - 50)  # Ajusta a posição Y para o chão
-            jeep.velocity_x = velocity_x  # Define a velocidade
-            self.jeeps.append(jeep)
+            # Reaproveita um jipe do pool; com o teto atingido, este spawn é pulado
+            jeep = self.jeep_pool.acquire()
+            if jeep is None:
+                return
+            jeep.reset(x, self.ground_y - 50, velocity_x)  # Ajusta a posição Y para o chão
+            jeep.on_destroy = self.despawn_jeep
+            self.jeeps[jeep] = None
             self.add_object(jeep)
 
+    def despawn_jeep(self, jeep):
+        """Tira o jipe da cena e o devolve ao pool."""
+        if self.jeeps.pop(jeep, 0) is None:
+            self.remove_object(jeep)
+            self.jeep_pool.release(jeep)
+
+    def recycle_offscreen_jeeps(self):
+        """Recicla os jipes que já saíram da tela e estão se afastando dela."""
+        screen_width = self.screen.get_width()
+        margin = self.JEEP_RECYCLE_MARGIN
+        for jeep in [jeep for jeep in self.jeeps
+                     if (jeep.velocity_x < 0 and jeep.x < -margin) or (jeep.velocity_x > 0 and jeep.x > screen_width + margin)]:
+            jeep.destroy()
+
+    @traced()
     def update_background(self):
         """Aplica parallax no fundo e adiciona/remove fundos conforme necessário."""
         screen_width, _ = self.screen.get_size()  # Obtém dinamicamente a largura da tela
 
+        self.scroll_step = 0
         if self.player is not None and self.player.velocity_x != 0:
+            self.scroll_step = self.player.velocity_x
             for bg in self.background:
                 bg["x"] -= self.player.velocity_x
 
@@ -148,13 +211,24 @@ class MainScene(GameScene):
             elif self.background[-1]["x"] > screen_width + 50:  # Fundo da direita
                 self.background.pop(-1)
 
-    def draw(self):
-        """Desenha a cena com o fundo, chão, personagem e jipes."""
-        for bg in self.background:
-            self.screen.blit(bg["image"], (bg["x"], bg["y"]))
-
+    @traced()
+    def draw(self, alpha=1.0):
+        """Envia o fundo para a fila de desenho; os objetos entram na fila em GameScene.late_update."""
+        # O fundo andou `scroll_step` pixels no último passo; volta a fração que ainda não deveria aparecer
+        offset = self.scroll_step * (1 - alpha)
+        positions = [(bg["x"] + offset, bg["y"]) for bg in self.background]
+        for bg, position in zip(self.background, positions):
+            self.render_queue.submit(bg["image"], position, layer=RenderQueue.BACKGROUND)
+        return positions
+
+    @traced()
     def late_update(self, params):
         """Método opcional chamado após o update()."""
-        self.update_background()
-        self.draw()
+        background = self.draw(params.get("alpha", 1.0))
+
+        # Quando o fundo se move a tela toda muda; parado, bastam as áreas dos objetos (veja GameScene)
+        damage = params.get("damage")
+        if damage is not None and (background != self.drawn_background or damage.needs_redraw(self)):
+            damage.mark_full()
+        self.drawn_background = background
         super().late_update(params)
\ No newline at end of file
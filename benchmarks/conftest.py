@@ -0,0 +1,135 @@
+import os
+import sys
+import json
+import statistics
+from time import perf_counter_ns
+
+import pytest
+
+# Roda sem janela: o driver de vídeo "dummy" do SDL permite criar superfícies e converter imagens
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+os.environ["ROOT_PATH"] = ROOT_PATH
+os.environ["LANG_PATH"] = os.path.join(ROOT_PATH, "locales")
+sys.path.insert(0, ROOT_PATH)
+os.chdir(ROOT_PATH)  # Os personagens usam caminhos relativos à raiz do projeto
+
+import pygame
+from scripts.collision_world import CollisionWorld
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-save", action="store_true", help="Grava os resultados como nova baseline.")
+    group.addoption("--bench-threshold", type=float, default=float(os.getenv("BENCH_THRESHOLD", "0.25")),
+                    help="Regressão máxima permitida em relação à baseline (0.25 = 25%% mais lento). "
+                         "Também pode ser definida pela variável BENCH_THRESHOLD.")
+    group.addoption("--bench-baseline", default=BASELINE_PATH, help="Arquivo JSON com as baselines.")
+
+
+class BenchmarkRunner:
+    def __init__(self, config):
+        self.save = config.getoption("--bench-save")
+        self.threshold = config.getoption("--bench-threshold")
+        self.baseline_path = config.getoption("--bench-baseline")
+        self.results = {}
+        self.baselines = {}
+        if os.path.exists(self.baseline_path):
+            with open(self.baseline_path, "r", encoding="utf-8") as file:
+                self.baselines = json.load(file)
+
+    def measure(self, name, func, iterations=100, repeats=7, warmup=1):
+        """
+        Mede `func` e compara com a baseline.
+
+        O resultado é a mediana (em microssegundos por chamada) de `repeats` execuções de
+        `iterations` chamadas cada. O teste falha se ficar mais lento que a baseline além do limite.
+        """
+        for _ in range(warmup * iterations):
+            func()
+
+        samples = []
+        for _ in range(repeats):
+            start = perf_counter_ns()
+            for _ in range(iterations):
+                func()
+            samples.append((perf_counter_ns() - start) / iterations / 1000)
+
+        median = statistics.median(samples)
+        self.results[name] = {"median_us": round(median, 3), "min_us": round(min(samples), 3)}
+
+        baseline = self.baselines.get(name)
+        if baseline and not self.save:
+            limit = baseline["median_us"] * (1 + self.threshold)
+            if median > limit:
+                pytest.fail(f"{name}: {median:.1f}us por chamada, baseline {baseline['median_us']:.1f}us "
+                            f"(limite {limit:.1f}us, +{self.threshold:.0%})")
+        return median
+
+    def write(self):
+        baselines = dict(self.baselines)
+        baselines.update(self.results)
+        with open(self.baseline_path, "w", encoding="utf-8") as file:
+            json.dump(dict(sorted(baselines.items())), file, indent=2)
+
+
+@pytest.fixture(scope="session")
+def bench_runner(request):
+    runner = BenchmarkRunner(request.config)
+    request.config._bench_runner = runner
+    yield runner
+    if runner.save and runner.results:
+        runner.write()
+
+
+@pytest.fixture
+def benchmark(bench_runner, request):
+    """Mede uma função: `benchmark(func, iterations=...)`. O nome do teste identifica a baseline."""
+    def run(func, **kwargs):
+        return bench_runner.measure(request.node.name, func, **kwargs)
+    return run
+
+
+@pytest.fixture(scope="session")
+def screen():
+    pygame.init()
+    surface = pygame.display.set_mode((1280, 720))
+    yield surface
+    pygame.quit()
+
+
+@pytest.fixture
+def update_params(screen):
+    """Parâmetros equivalentes aos montados por Main.run a cada frame."""
+    return {
+        "dt": 1 / 60,
+        "screen": screen,
+        "main_update": lambda params: None,
+        "collision_world": CollisionWorld(),
+        "key_events": {"key": None, "type": None},
+        "mouse_events": {"pos": (0, 0), "buttons": (False, False, False)},
+        "pressed_keys": pygame.key.ScancodeWrapper([False] * 512),
+        "selected_character": None,
+        "event_manager": None,
+        "menus": [],
+    }
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    runner = getattr(config, "_bench_runner", None)
+    if runner is None or not runner.results:
+        return
+
+    terminalreporter.section("benchmarks (mediana por chamada)")
+    for name, result in sorted(runner.results.items()):
+        baseline = runner.baselines.get(name)
+        change = ""
+        if baseline:
+            change = f"  {result['median_us'] / baseline['median_us'] - 1:+.1%} vs baseline"
+        terminalreporter.write_line(f"{name:<55} {result['median_us']:>12.1f}us{change}")
+    if runner.save:
+        terminalreporter.write_line(f"Baselines gravadas em {runner.baseline_path}")
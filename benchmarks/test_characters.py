@@ -0,0 +1,26 @@
+from scripts.character_registry import CharacterRegistry
+
+CHARACTERS = '''
+from scripts.character import Character
+from scripts.animation import AnimationDescriptor
+
+class Good(Character):
+    NAME = "Goodie"
+    ANIMATIONS = {"idle": AnimationDescriptor("idle.png", "idle.json", loop=True)}
+
+class NoIdle(Character):
+    ANIMATIONS = {"walk": AnimationDescriptor("walk.png", "walk.json")}
+'''
+
+
+def test_character_registry_skips_broken_class(tmp_path, monkeypatch):
+    """Uma classe sem animação "idle" é pulada; as outras entram no índice com o nome de NAME."""
+    package = tmp_path / "test_characters_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "mixed.py").write_text(CHARACTERS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    registry = CharacterRegistry(str(package), "test_characters_pkg", str(tmp_path / "characters.json"))
+    assert [(entry.name, entry.class_name) for entry in registry.entries()] == [("GOODIE", "Good")]
+    assert registry.find("goodie").preview["spritesheet_path"] == "idle.png"
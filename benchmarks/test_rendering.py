@@ -0,0 +1,37 @@
+import pytest
+
+
+@pytest.fixture
+def bitmap_font(screen):
+    from assets.fonts.title_font import bitmap_font
+    return bitmap_font
+
+
+@pytest.mark.parametrize("text", ["START", "SELECT YOUR CHARACTER"])
+def test_bitmap_font_render(benchmark, bitmap_font, text):
+    benchmark(lambda: bitmap_font.render(text, "white", 32))
+
+
+@pytest.fixture
+def animation(screen):
+    from scripts.animation import Animation
+    return Animation("./assets/sprites/blaze/walk.png", "./assets/animations/blaze/walk.json", use_velocity=True, loop=True)
+
+
+def test_animation_update(benchmark, animation):
+    benchmark(lambda: animation.update(0.15), iterations=1000)
+
+
+@pytest.mark.parametrize("size", [None, (96, 128)], ids=["native", "scaled"])
+def test_animation_get_frame(benchmark, animation, size):
+    def step():
+        animation.update(0.15)
+        animation.get_frame(size)
+    benchmark(step, iterations=500)
+
+
+def test_character_draw(benchmark, screen):
+    from assets.characters.blaze import Blaze
+
+    character = Blaze(640, 500)
+    benchmark(lambda: character.draw(screen), iterations=500)
@@ -0,0 +1,32 @@
+import pytest
+
+
+@pytest.fixture
+def scene(screen, update_params):
+    from assets.scenes.main_scene import MainScene
+
+    scene = MainScene(screen)
+    update_params["main_update"] = lambda values: update_params.update(values)
+    scene.update(update_params)  # Cria e posiciona o personagem padrão
+    return scene
+
+
+def test_update_background(benchmark, scene):
+    scene.player.velocity_x = 6  # Força o parallax e a troca de fundos
+    benchmark(scene.update_background, iterations=500)
+
+
+@pytest.mark.parametrize("jeeps", [0, 10, 50])
+def test_main_scene_frame(benchmark, scene, update_params, jeeps):
+    from assets.objects.jeep import Jeep
+
+    screen_width = scene.screen.get_width()
+    for i in range(jeeps):
+        jeep = Jeep(i * screen_width // max(jeeps, 1), scene.ground_y - 50, width=205, height=79)
+        jeep.lifetime = float("inf")  # Mantém o jipe vivo durante toda a medição
+        scene.add_object(jeep)
+
+    def frame():
+        scene.update(update_params)
+        scene.late_update(update_params)
+    benchmark(frame, iterations=30, repeats=5)
@@ -0,0 +1,42 @@
+import json
+import os
+
+import pytest
+
+from scripts.settings_store import SettingsStore
+
+
+def test_settings_debounced_save(tmp_path, monkeypatch):
+    """Alterações seguidas viram uma única gravação, por arquivo temporário trocado com os.replace."""
+    path = tmp_path / "settings.json"
+    store = SettingsStore(path=str(path), save_delay=0.05)
+    replaced = []
+    os_replace = os.replace
+    monkeypatch.setattr(os, "replace", lambda src, dst: (replaced.append((src, dst)), os_replace(src, dst)))
+
+    store.set("sound", 10)
+    store.set("sound", 20)
+    store.set("language", "pt")
+    timer = store._timer
+    assert not path.exists()  # Nada é gravado antes do intervalo
+
+    timer.join()
+    assert replaced == [(f"{path}.tmp", str(path))]
+    assert not os.path.exists(f"{path}.tmp")
+    with open(path, "r", encoding="utf-8") as file:
+        assert json.load(file) == {**SettingsStore.DEFAULTS, "sound": 20, "language": "pt"}
+
+
+def test_settings_difficulty_choices(tmp_path):
+    """A dificuldade padrão é uma das opções do menu e valores fora delas são recusados."""
+    path = tmp_path / "settings.json"
+    store = SettingsStore(path=str(path))
+    store.persistent = False
+    assert store["difficulty"] in SettingsStore.CHOICES["difficulty"]
+    with pytest.raises(ValueError):
+        store.set("difficulty", "normal")
+
+    # Um arquivo antigo com valor inválido é carregado com o padrão
+    path.write_text(json.dumps({"difficulty": "normal"}), encoding="utf-8")
+    store.load()
+    assert store["difficulty"] == SettingsStore.DEFAULTS["difficulty"]
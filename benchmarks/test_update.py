@@ -0,0 +1,155 @@
+import pytest
+from event_manager import EventManager
+
+
+class Subscriber:
+    """Inscrito mínimo: mede só o custo do despacho do EventManager."""
+    def update(self, params):
+        pass
+
+    def late_update(self, params):
+        pass
+
+
+@pytest.mark.parametrize("count", [10, 100, 1000])
+def test_event_manager_update(benchmark, update_params, count):
+    event_manager = EventManager()
+    for _ in range(count):
+        event_manager.subscribe(Subscriber())
+
+    def frame():
+        event_manager.update(update_params)
+        event_manager.late_update(update_params)
+    benchmark(frame, iterations=200)
+
+
+def test_collision_resolve(benchmark, screen):
+    from assets.characters.rollerblader import Rollerblader
+    from assets.objects.jeep import Jeep
+
+    player = Rollerblader()
+    player.set_position(300, 600)
+    jeep = Jeep(300, 650, width=205, height=79, use_collision=True, pixel_perfect=False)
+    component = player.collision_component
+    benchmark(lambda: component.resolve_collision(jeep.collision_component), iterations=5000)
+
+
+def test_collision_pixel_perfect(benchmark, screen):
+    from assets.characters.rollerblader import Rollerblader
+    from assets.objects.jeep import Jeep
+
+    player = Rollerblader()
+    player.set_position(300, 600)
+    jeep = Jeep(300, 650, width=205, height=79, use_collision=True)  # Jipe usa máscara por padrão
+    component = player.collision_component
+    component.check_collision(jeep.collision_component)  # Máscaras já em cache, como no jogo
+    benchmark(lambda: component.check_collision(jeep.collision_component), iterations=5000)
+
+
+class Body:
+    """Dono mínimo de um CollisionComponent, para povoar o mundo sem carregar sprites."""
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.gravity_component = None
+
+
+def test_collision_left_half_of_sprite(screen):
+    """Caixa, máscara e CollisionWorld usam o mesmo referencial (centrado em x, y), inclusive à esquerda do centro."""
+    from assets.objects.jeep import Jeep
+    from scripts.collision_component import CollisionComponent
+    from scripts.collision_world import CollisionWorld
+
+    jeep = Jeep(640, 600, width=205, height=79, use_collision=True)
+    mask, (left, top) = jeep.collision_component.mask()
+    # Um pixel visível na metade esquerda do jipe (atrás do centro x)
+    hit_x, hit_y = next((x, y) for y in range(mask.get_size()[1]) for x in range(mask.get_size()[0])
+                        if mask.get_at((x, y)) and left + x < jeep.x - 20)
+    body = Body(left + hit_x, top + hit_y)
+    component = CollisionComponent(body, 4, 4)
+
+    assert component.check_collision(jeep.collision_component)
+    assert jeep.collision_component.check_collision(component)
+
+    world = CollisionWorld()
+    world.register(jeep.collision_component)
+    assert jeep.collision_component in world.query(*component.aabb())
+
+    # Longe do sprite à esquerda não há colisão
+    body.x = left - 20
+    assert not component.check_collision(jeep.collision_component)
+
+
+@pytest.mark.parametrize("count", [100, 1000])
+def test_collision_world_step(benchmark, count):
+    import random
+    from scripts.collision_component import CollisionComponent
+    from scripts.collision_world import CollisionWorld
+
+    rng = random.Random(1)
+    level_width = count * 40  # Densidade de uma fase comprida: poucos vizinhos por objeto
+    world = CollisionWorld()
+    components = []
+    for _ in range(count):
+        body = Body(rng.uniform(0, level_width), rng.uniform(400, 700))
+        body.velocity_x = rng.uniform(-5, 5)
+        component = CollisionComponent(body, 205, 79)
+        world.register(component)
+        components.append(component)
+
+    def step():
+        # Um passo com todos se movendo e cada um consultando os vizinhos
+        for component in components:
+            body = component.owner
+            body.x = (body.x + body.velocity_x) % level_width
+            world.update(component)
+        for component in components:
+            for other in world.query(*component.aabb()):
+                if other is not component:
+                    component.check_collision(other)
+    benchmark(step, iterations=5, repeats=5)
+
+
+@pytest.mark.parametrize("count", [1000, 10000])
+def test_component_store_step(benchmark, count):
+    from scripts.component_store import ComponentStore
+    import numpy as np
+
+    store = ComponentStore()
+    owners = [Body(0, 0) for _ in range(count)]
+    rows = np.array([store.allocate(owner, x=i, y=600, vx=-2) for i, owner in enumerate(owners)], dtype=np.intp)
+    benchmark(lambda: store.step(rows, 1 / 60, delta_x=1.5), iterations=200)
+
+
+def test_component_store_step_matches_update(screen, update_params):
+    """O passo em lote de GameScene dá a mesma posição que o update objeto a objeto."""
+    from assets.objects.jeep import Jeep
+    from scripts.animation import Animation
+    from scripts.car import Car
+    from scripts.game_scene import GameScene
+
+    def simulate(vectorized):
+        jeep = Jeep(640, 500, width=205, height=79, use_gravity=True)
+        jeep.VECTORIZED = vectorized
+        car = Car(100, 500, {"idle": Animation("./assets/sprites/jeep/jeep_drive.png", "./assets/animations/jeep/jeep_drive.json")})
+        car.move(3)  # Um deslocamento só: um Car não continua andando sozinho
+        scene = GameScene(screen)
+        scene.add_object(jeep)
+        scene.add_object(car)
+        for _ in range(10):
+            scene.update({**update_params, "delta_x": 1.5})
+        return [(obj.x, obj.y) for obj in (jeep, car)]
+
+    batched = simulate(True)
+    assert batched == simulate(False)
+    assert batched[1][0] == 103 + 10 * 1.5
+
+
+def test_log_disabled_level(benchmark):
+    """Um log.debug com o nível desabilitado (o caso de Jeep.destroy) deve custar quase nada."""
+    import logging
+    from scripts.game_log import get_logger
+
+    log = get_logger("benchmarks.disabled")
+    log.setLevel(logging.INFO)
+    benchmark(lambda: log.debug("Jeep destroyed! %s", 1), iterations=5000)
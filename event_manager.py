@@ -1,12 +1,14 @@
 import importlib.util
 import inspect
 import os
+from time import perf_counter_ns
 
 class EventManager:
   MODULE_NAME = "event_manager"
   """Gerencia os objetos que precisam ser atualizados a cada frame."""
   def __init__(self):
     self.subscribers = []
+    self.profiler = None  # FrameProfiler opcional; só mede quando estiver habilitado
 
   def subscribe(self, obj):
     """Adiciona um objeto à lista de atualização."""
@@ -20,14 +22,31 @@ class EventManager:
 
   def update(self, params):
     """Chama o método update() de todos os inscritos."""
+    profiler = self.profiler
+    if profiler is None or not profiler.enabled:
+      for obj in self.subscribers:
+        obj.update(params)
+      return
+
     for obj in self.subscribers:
+      start = perf_counter_ns()
       obj.update(params)
+      profiler.record(obj, "update", perf_counter_ns() - start)
 
   def late_update(self, params):
     """Chama o método late_update() de todos os inscritos."""
+    profiler = self.profiler
+    if profiler is None or not profiler.enabled:
+      for obj in self.subscribers:
+        if hasattr(obj, "late_update") and callable(getattr(obj, "late_update")):
+          obj.late_update(params)
+      return
+
     for obj in self.subscribers:
       if hasattr(obj, "late_update") and callable(getattr(obj, "late_update")):
+        start = perf_counter_ns()
         obj.late_update(params)
+        profiler.record(obj, "late_update", perf_counter_ns() - start)
 
 if __name__ == "__main__":
   event_manager = EventManager()
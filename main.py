@@ -1,7 +1,8 @@
+from scripts.startup_trace import startup  # Primeiro import: mede o tempo de todos os outros
 import pygame
 import os
 import sys
-import json
+import argparse
 
 ROOT_PATH = os.path.abspath(os.path.dirname(__file__))
 LANG_PATH = os.path.join(ROOT_PATH, "locales")
@@ -9,36 +10,65 @@ os.environ["ROOT_PATH"] = ROOT_PATH
 os.environ["LANG_PATH"] = LANG_PATH
 
 from event_manager import EventManager
-from ui.main_menu import MainMenu
-from ui.settings_menu import SettingsMenu
-from ui.character_selection_menu import CharacterSelectMenu
-from scripts.character import Character
-from ui.bitmap_font import BitmapFont
+from ui.lazy_menus import LazyMenus
+from scripts.scene_loader import SceneLoader
+from scripts.frame_profiler import FrameProfiler
+from scripts.tracing import tracer, span
+from scripts.input_recorder import LiveInput, InputRecorder, InputReplay
+from scripts.display_damage import DisplayDamage
+from scripts.collision_world import CollisionWorld
+from scripts.settings_store import settings
+from scripts.asset_cache import asset_cache
+from scripts.game_log import get_logger
 
-CONFIG_PATH = os.path.join(ROOT_PATH, "config", "settings.json")
+log = get_logger(__name__)
 
 class Main:
     SELECTED_CHARACTER = None
     MENUS = []
     CURRENT_MENU = None
     CURRENT_SCENE = None
-    COLLIDABLES = []
-    SETTINGS = {}
+    COLLISION_WORLD = None
 
     FADE_SURFACE = None
     FADE_ALPHA = 0
     FADING = False
     FADE_OUT = True
     NEXT_MENU = None
+    SCENE_LOADER = None
 
-    def __init__(self):
-        self.load_settings()
+    SIMULATION_STEP = 1 / 60  # Passo fixo da simulação; as constantes do jogo são ajustadas por passo
+    MAX_STEPS_PER_FRAME = 5  # Limite de passos de recuperação depois de um frame lento
+
+    def __init__(self, record_path=None, replay_path=None, replay_report=None):
+        """
+        :param record_path: Grava a entrada da sessão neste arquivo (veja scripts/input_recorder.py).
+        :param replay_path: Reproduz uma sessão gravada em vez de ler o teclado e o mouse.
+        :param replay_report: Arquivo JSON com o tempo de cada frame reproduzido.
+        """
+        if replay_path:
+            self.input = InputReplay(replay_path, replay_report)
+            settings.persistent = False  # O replay não altera as configurações do jogador
+            settings.replace(self.input.settings)  # A sessão gravada usa as configurações da época
+        else:
+            with startup.measure("settings.load"):
+                settings.load()
+            self.input = InputRecorder(record_path, settings.snapshot()) if record_path else LiveInput()
         self.event_manager = EventManager()
+        self.profiler = FrameProfiler()  # F3 liga/desliga o overlay de desempenho
+        self.event_manager.profiler = self.profiler
+        self.damage = DisplayDamage((1280, 720))  # Regiões da tela que mudaram no frame
+        self.COLLISION_WORLD = CollisionWorld()  # Broadphase de colisão compartilhado pelas cenas
         self.__subscribe_main_events()
         self.run()
 
     def __subscribe_main_events(self):
-        self.MENUS = [MainMenu(), SettingsMenu(), CharacterSelectMenu()]
+        # Cada menu é importado e construído só quando é aberto pela primeira vez
+        self.MENUS = LazyMenus([
+            ("ui.main_menu", "MainMenu"),
+            ("ui.settings_menu", "SettingsMenu"),
+            ("ui.character_selection_menu", "CharacterSelectMenu"),
+        ])
         self.CURRENT_MENU = self.MENUS[0]
         self.__update_menus()
 
@@ -47,107 +77,141 @@ class Main:
             if menu != self.CURRENT_MENU:
                 self.event_manager.unsubscribe(menu)
 
+        self.damage.invalidate()
         if self.CURRENT_MENU:
             self.event_manager.subscribe(self.CURRENT_MENU)
-            print(f"📜 Menu atual: {self.CURRENT_MENU}")
-            print(f"Eventos inscritos: {self.event_manager.subscribers}")
+            log.debug("📜 Menu atual: %s", self.CURRENT_MENU)
+            log.debug("Eventos inscritos: %s", self.event_manager.subscribers)
 
     def run(self):
-        pygame.init()
-        screen = pygame.display.set_mode((1280, 720))
+        with startup.measure("pygame.init"):
+            pygame.init()
+        with startup.measure("pygame.display.set_mode"):
+            screen = pygame.display.set_mode((1280, 720))
+        self.screen = screen
         clock = pygame.time.Clock()
         running = True
         click_cooldown = 0
         dt = 0
+        accumulator = 0
+        pending_key_event = None  # Entrada que chegou num frame sem passo de simulação
+        pending_buttons = None
+        stepped = False  # Algum passo de simulação já rodou (o que está na tela é um menu de verdade)
         
         self.FADE_SURFACE = pygame.Surface((1280, 720))
         self.FADE_SURFACE.fill((0, 0, 0))
 
-        if "selected_character" in self.SETTINGS:
-            print(f"🔵 Personagem selecionado: {self.SETTINGS['selected_character']}")
-            self.SELECTED_CHARACTER = self.get_character()
+        # O personagem salvo só é criado ao abrir a cena (veja main_update), fora do primeiro frame
         
         while running:
-            key_event = {"key": None, "type": None}
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                    break
-                elif event.type == pygame.KEYDOWN:
-                    key_event = {"key": event.key, "type": pygame.KEYDOWN}
-                elif event.type == pygame.KEYUP:
-                    key_event = {"key": event.key, "type": pygame.KEYUP}
-
-            pygame.display.flip()
-            mouse_pressed_event = pygame.mouse.get_pressed()
-            if click_cooldown > 0:
-                mouse_pressed_event = (False, False, False)
-            else:
-                click_cooldown = 5
-            update_params = {
-                "dt": dt,
-                "screen": screen,
-                "main_update": self.main_update,
-                "collidables": self.COLLIDABLES,
-                "key_events": key_event,
-                "mouse_events": {"pos": pygame.mouse.get_pos(), "buttons": mouse_pressed_event},
-                "selected_character": self.SELECTED_CHARACTER,
-                "event_manager": self.event_manager,
-                "menus": self.MENUS,
-            }
-            
-            if self.FADING:
-                self.handle_fade(screen)
-            else:
-                self.event_manager.update(update_params)
-                self.event_manager.late_update(update_params)
-
-            dt = clock.tick(60) / 1000
+            if self.profiler.enabled:
+                self.profiler.begin_frame()
+            with span("frame"):
+                key_event = pending_key_event or {"key": None, "type": None}
+                with span("events"):
+                    frame_input = self.input.poll(dt)
+                    dt = frame_input.dt
+                    if frame_input.quit:
+                        running = False
+                    for event_type, key in frame_input.key_events:
+                        if event_type == pygame.KEYDOWN and key == pygame.K_F3:
+                            self.profiler.toggle()
+                            self.damage.invalidate()
+                        elif event_type == pygame.KEYDOWN and key == pygame.K_F4:
+                            tracer.flush()
+                        else:
+                            key_event = {"key": key, "type": event_type}
+
+                with span("display.update"):
+                    self.damage.present()
+                asset_cache.run_conversions()  # convert_alpha pedido pelas threads de carregamento
+                if stepped and startup.first_frame_ms is None:
+                    startup.mark_first_frame()  # O frame enviado agora já foi desenhado depois de um passo
+                mouse_pressed_event = frame_input.mouse_buttons
+                if click_cooldown > 0:
+                    mouse_pressed_event = (False, False, False)
+                else:
+                    click_cooldown = 5
+                if pending_buttons is not None:
+                    mouse_pressed_event = tuple(a or b for a, b in zip(mouse_pressed_event, pending_buttons))
+                update_params = {
+                    "dt": self.SIMULATION_STEP,
+                    "screen": screen,
+                    "main_update": self.main_update,
+                    "collision_world": self.COLLISION_WORLD,
+                    "key_events": key_event,
+                    "mouse_events": {"pos": frame_input.mouse_pos, "buttons": mouse_pressed_event},
+                    "pressed_keys": frame_input.pressed_keys,
+                    "selected_character": self.SELECTED_CHARACTER,
+                    "event_manager": self.event_manager,
+                    "menus": self.MENUS,
+                    "damage": self.damage,
+                }
+
+                if self.FADING:
+                    accumulator = 0
+                    with span("handle_fade"):
+                        self.handle_fade(screen)
+                    self.damage.invalidate()  # O fade cobre a tela inteira
+                else:
+                    # Passos fixos de simulação para o tempo acumulado; o desenho interpola entre os dois últimos
+                    accumulator += dt
+                    steps = 0
+                    while accumulator >= self.SIMULATION_STEP and steps < self.MAX_STEPS_PER_FRAME and not self.FADING:
+                        with span("event_manager.update"):
+                            self.event_manager.update(update_params)
+                        # A entrada do frame é consumida pelo primeiro passo
+                        update_params["key_events"] = {"key": None, "type": None}
+                        update_params["mouse_events"] = {"pos": frame_input.mouse_pos, "buttons": (False, False, False)}
+                        accumulator -= self.SIMULATION_STEP
+                        steps += 1
+                    if steps == self.MAX_STEPS_PER_FRAME:
+                        accumulator %= self.SIMULATION_STEP  # Descarta o atraso em vez de travar tentando recuperá-lo
+
+                    if steps:
+                        stepped = True
+                        pending_key_event = pending_buttons = None
+                    else:
+                        pending_key_event = key_event if key_event["key"] is not None else pending_key_event
+                        pending_buttons = mouse_pressed_event if any(mouse_pressed_event) else pending_buttons
+
+                    update_params["alpha"] = min(1.0, accumulator / self.SIMULATION_STEP)
+                    with span("event_manager.late_update"):
+                        self.event_manager.late_update(update_params)
+                    # Inscritos que não informam o que desenharam obrigam a atualizar a tela inteira
+                    if not all(getattr(obj, "REPORTS_DAMAGE", False) for obj in self.event_manager.subscribers):
+                        self.damage.mark_full()
+
+                if self.profiler.enabled:
+                    self.profiler.draw(screen)
+                    self.damage.mark_full()
+                    self.profiler.end_frame()
+
+            self.input.end_frame()
+            with span("clock.tick"):
+                # No replay o jogo roda sem limite de FPS; o dt vem da gravação
+                dt = clock.tick(60 if self.input.realtime else 0) / 1000
             click_cooldown -= 1
 
+        self.input.close()
+        settings.flush()
         pygame.quit()
 
     def main_update(self, params):
         if "selected_character" in params:
-            print(f"🔵 Personagem selecionado: {params['selected_character']}")
+            log.debug("🔵 Personagem selecionado: %s", params["selected_character"])
             self.SELECTED_CHARACTER = params["selected_character"]
-        if "collidable" in params:
-            self.COLLIDABLES.append(params["collidable"])
         if "settings" in params:
             self.save_settings(params["settings"])
         if "current_scene" in params:
             self.CURRENT_SCENE = params["current_scene"]
             self.event_manager.subscribe(self.CURRENT_SCENE)
+        if "load_scene" in params:
+            # A cena é criada só quando seus assets (inclusive o personagem salvo) terminarem de carregar (veja handle_fade)
+            self.SCENE_LOADER = SceneLoader(params["load_scene"], self.screen)
         if "current_menu" in params:
             self.start_fade(params["current_menu"])
 
-    def get_character(self):
-        characters = []
-
-        characters_path = os.path.join(ROOT_PATH, "assets", "characters")
-        for file in os.listdir(characters_path):
-            if file.endswith(".py") and file != "__init__.py":
-                character_module = file.replace(".py", "")
-                print(f"🔵 Importando personagem: {character_module}")
-
-                try:
-                    module = __import__(f"assets.characters.{character_module}", fromlist=[character_module])
-                    class_name = character_module.capitalize()  # Assume que a classe tem o mesmo nome do arquivo com a primeira letra maiúscula
-                    character_class = getattr(module, class_name, None)
-
-                    print(f"🔵 Classe encontrada: {character_class}\nNome da Classe: {class_name}")
-
-                    if character_class and issubclass(character_class, Character):
-                        characters.append(character_class())
-                except Exception as e:
-                    print(f"⚠️ Erro ao importar {character_module}: {e}")
-
-        # Busca o personagem correspondente no JSON
-        return next(
-            (char for char in characters if char.__class__.__name__.upper() == self.SETTINGS["selected_character"].upper()),
-            None
-        )
-
     def start_fade(self, next_menu):
         """Inicia a transição de fade para o novo menu."""
         self.FADING = True
@@ -161,9 +225,19 @@ class Main:
             self.FADE_ALPHA += 15  # Velocidade do fade (ajuste se necessário)
             if self.FADE_ALPHA >= 255:
                 self.FADE_ALPHA = 255
+
+                # Mantém a tela de carregamento até a próxima cena estar toda em memória
+                if self.SCENE_LOADER is not None and not self.input.scene_ready(self.SCENE_LOADER):
+                    self.draw_loading_screen(screen, self.SCENE_LOADER.progress())
+                    return
+
                 self.FADE_OUT = False  # Agora começa o fade in
                 self.CURRENT_MENU = self.NEXT_MENU
                 self.__update_menus()
+                if self.SCENE_LOADER is not None:
+                    screen.fill((0, 0, 0))
+                    self.main_update({"current_scene": self.SCENE_LOADER.build()})
+                    self.SCENE_LOADER = None
         else:
             self.FADE_ALPHA -= 15
             if self.FADE_ALPHA <= 0:
@@ -172,42 +246,33 @@ class Main:
         
         self.FADE_SURFACE.set_alpha(self.FADE_ALPHA)
         screen.blit(self.FADE_SURFACE, (0, 0))
-        pygame.display.update()
-
-    def save_settings(self, new_settings):
-        """Atualiza ou adiciona configurações sem remover as existentes."""
-        os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
 
-        # Carrega as configurações existentes, se houver
-        if os.path.exists(CONFIG_PATH):
-            with open(CONFIG_PATH, "r", encoding="utf-8") as file:
-                current_settings = json.load(file)
-        else:
-            current_settings = {}
-
-        # Atualiza apenas as chaves fornecidas sem remover as outras
-        current_settings.update(new_settings)
-
-        # Salva de volta no arquivo JSON
-        with open(CONFIG_PATH, "w", encoding="utf-8") as file:
-            json.dump(current_settings, file, indent=4)
+    def draw_loading_screen(self, screen, progress):
+        """Desenha a barra de progresso do carregamento da cena."""
+        from assets.fonts.title_font import bitmap_font
 
-        # Atualiza o dicionário de configurações da classe
-        self.SETTINGS = current_settings
+        screen.fill((0, 0, 0))
+        bar = pygame.Rect(0, 0, 400, 16)
+        bar.center = (screen.get_width() // 2, screen.get_height() // 2)
+        pygame.draw.rect(screen, (255, 255, 255), bar, 2)
+        pygame.draw.rect(screen, (255, 255, 0), (bar.x + 4, bar.y + 4, int((bar.width - 8) * progress), bar.height - 8))
 
-        print("💾 Configurações salvas com sucesso!")
+        text_surface = bitmap_font.render(f"{int(progress * 100)}%", "white", 16)
+        screen.blit(text_surface, text_surface.get_rect(center=(bar.centerx, bar.bottom + 24)))
 
-    def load_settings(self):
-        if os.path.exists(CONFIG_PATH):
-            with open(CONFIG_PATH, "r", encoding="utf-8") as file:
-                self.SETTINGS = json.load(file)
-            print("🔄 Configurações carregadas com sucesso!")
-        else:
-            self.SETTINGS = {"sound": 100, "language": "en", "difficulty": "normal", "selected_character": None}
-            self.save_settings(self.SETTINGS)
-            print("⚠️ Nenhuma configuração encontrada. Criando padrão.")
-            
-        os.environ["SETTINGS"] = json.dumps(self.SETTINGS)
+    def save_settings(self, new_settings):
+        """Atualiza ou adiciona configurações sem remover as existentes (gravadas em segundo plano)."""
+        settings.update(new_settings)
 
 if __name__ == "__main__":
-    Main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="ProjetoFinalPOO")
+    parser.add_argument("--record", metavar="ARQUIVO", help="Grava a entrada da sessão para reprodução posterior.")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="Reproduz uma sessão gravada, sem limite de FPS.")
+    parser.add_argument("--headless", action="store_true", help="No replay, roda sem abrir janela.")
+    parser.add_argument("--replay-report", metavar="ARQUIVO", help="Grava o tempo de cada frame reproduzido em JSON.")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    Main(record_path=args.record, replay_path=args.replay, replay_report=args.replay_report)
\ No newline at end of file
@@ -1,10 +1,26 @@
+import weakref
+from collections import OrderedDict
 import pygame
-import json
+from scripts.asset_cache import asset_cache, AnimationFrames, surface_bytes
+from scripts.asset_pack import asset_pack
+from scripts.texture_atlas import texture_atlas
 
 class Animation:
+    TRANSFORM_CACHE_SIZE = 64  # Máximo de frames derivados (escalados/espelhados) guardados por animação
+    MASK_CACHE_SIZE = 128  # Máximo de máscaras de colisão por spritesheet (compartilhadas entre instâncias)
+
     def __init__(self, spritesheet_path, json_path, use_velocity=False, loop=True, animation_speed=1):
-        self.spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
-        self.frames = self.load_frames(json_path)
+        # Os frames são compartilhados entre todas as instâncias que usam a mesma spritesheet/JSON
+        self.asset_key, asset = asset_cache.acquire(
+            "animation", (spritesheet_path, json_path),
+            lambda: self.build_frames(spritesheet_path, json_path)
+        )
+        weakref.finalize(self, asset_cache.release, self.asset_key)
+
+        self.frames = asset.frames
+        self.offsets = asset.offsets
+        self.masks = asset.masks
+        self.max_width, self.max_height = asset.max_width, asset.max_height
         self.animation_speed = animation_speed
         self.current_frame = 0
         self.animation_time = 0
@@ -12,52 +28,88 @@ class Animation:
         self.flipped = False
         self.loop = loop
 
-        # Calcula o tamanho máximo dos frames para manter a consistência da animação
-        self.max_width, self.max_height = self.get_max_sprite_size()
-        self.frames = self.normalize_frames(self.frames, self.max_width, self.max_height)
+        # Cache de frames derivados: (índice, espelhado, tamanho) -> (superfície, deslocamento)
+        self.transform_cache = OrderedDict()
+        self.transform_hits = 0
+        self.transform_misses = 0
+
+    @classmethod
+    def prefetch(cls, spritesheet_path, json_path):
+        """Carrega os frames da animação em segundo plano, para que a primeira instância não precise esperar."""
+        asset_cache.prefetch("animation", (spritesheet_path, json_path), lambda: cls.build_frames(spritesheet_path, json_path))
 
-    def load_frames(self, json_path):
-        """Carrega os frames da spritesheet com base no JSON."""
-        with open(json_path, "r") as file:
-            data = json.load(file)
+    @classmethod
+    def build_frames(cls, spritesheet_path, json_path):
+        """Obtém os frames do pacote pré-processado ou, se ele estiver ausente/desatualizado, dos arquivos soltos."""
+        animation = asset_pack.load_animation(spritesheet_path, json_path)
+        if animation is None:
+            animation = cls.decode_frames(spritesheet_path, json_path)
+        return animation, sum(surface_bytes(frame) for frame in animation.frames)
+
+    @classmethod
+    def decode_frames(cls, spritesheet_path, json_path):
+        """Recorta os frames (do atlas, se disponível, ou da spritesheet) e os reduz à área visível."""
+        data = asset_cache.load_json(json_path)
+        frames = texture_atlas.get_frames(spritesheet_path, [(f["x"], f["y"], f["width"], f["height"]) for f in data])
+        from_atlas = frames is not None
+        if not from_atlas:
+            frames = cls.load_frames(asset_cache.load_image(spritesheet_path), data)
+
+        # Calcula o tamanho máximo dos frames para manter a consistência da animação
+        max_width, max_height = cls.get_max_sprite_size(frames)
+        # Fora do atlas os frames são copiados, para que a spritesheet inteira não fique presa na memória
+        frames, offsets = cls.trim_frames(frames, max_width, max_height, copy=not from_atlas)
+        return AnimationFrames(frames, max_width, max_height, offsets)
 
+    @staticmethod
+    def load_frames(spritesheet, data):
+        """Recorta os frames da spritesheet com base nos dados do JSON."""
         frames = []
         for frame_info in data:
             x, y, width, height = frame_info["x"], frame_info["y"], frame_info["width"], frame_info["height"]
-            frame = self.spritesheet.subsurface(pygame.Rect(x, y, width, height))
+            frame = spritesheet.subsurface(pygame.Rect(x, y, width, height))
             frames.append(frame)
 
         return frames
 
-    def get_max_sprite_size(self):
+    @staticmethod
+    def get_max_sprite_size(frames):
         """Percorre todos os frames para encontrar o maior tamanho."""
         max_width = 0
         max_height = 0
-        for frame in self.frames:
+        for frame in frames:
             width, height = frame.get_size()
             max_width = max(max_width, width)
             max_height = max(max_height, height)
         return max_width, max_height
 
-    def normalize_frames(self, frames, max_width, max_height):
-        """Ajusta os frames menores adicionando espaço transparente apenas na parte superior para manter o tamanho fixo."""
-        normalized_frames = []
+    @staticmethod
+    def trim_frames(frames, max_width, max_height, copy=False):
+        """
+        Corta a área transparente de cada frame e calcula onde ele fica no quadro de tamanho máximo.
+
+        O deslocamento reproduz o alinhamento antigo (centralizado na horizontal e apoiado na base),
+        de modo que desenhar o frame recortado no deslocamento equivale a desenhar o frame com bordas.
+
+        :return: (frames recortados, deslocamentos (x, y) relativos ao quadro max_width x max_height)
+        """
+        trimmed_frames = []
+        offsets = []
         for frame in frames:
             original_width, original_height = frame.get_size()
 
-            # Criar um novo canvas transparente do tamanho do maior frame
-            canvas = pygame.Surface((max_width, max_height), pygame.SRCALPHA)
-            canvas.fill((0, 0, 0, 0))  # Fundo transparente
-
             # Centralizar horizontalmente e alinhar pela base
             x_offset = (max_width - original_width) // 2
-            y_offset = max_height - original_height  # Alinha os pés na base do canvas
+            y_offset = max_height - original_height  # Alinha os pés na base do quadro
 
-            # Desenhar o frame no canvas
-            canvas.blit(frame, (x_offset, y_offset))
-            normalized_frames.append(canvas)
+            bounds = frame.get_bounding_rect()
+            if bounds.width == 0 or bounds.height == 0:
+                bounds = pygame.Rect(0, 0, 1, 1)  # Frame totalmente transparente
+            trimmed = frame.subsurface(bounds)
+            trimmed_frames.append(trimmed.copy() if copy else trimmed)
+            offsets.append((x_offset + bounds.x, y_offset + bounds.y))
 
-        return normalized_frames
+        return trimmed_frames, offsets
 
     def frame_count(self):
         """Retorna o número total de frames na animação."""
@@ -86,12 +138,93 @@ class Animation:
         """Ajusta a velocidade da animação."""
         self.animation_speed = max(1, new_speed)  # Evita valores inválidos
 
-    def get_frame(self):
-        """Retorna o frame atual da animação, invertendo se necessário."""
-        frame = self.frames[self.current_frame]
-        if self.flipped:
+    def get_frame(self, size=None):
+        """Retorna (superfície, deslocamento) do frame atual, invertendo e escalando se necessário."""
+        return self.get_frame_at(self.current_frame, size)
+
+    def get_mask(self, size=None):
+        """Retorna (máscara, deslocamento) do frame atual, para colisão por pixel."""
+        return self.get_mask_at(self.current_frame, size)
+
+    def get_mask_at(self, index, size=None, flipped=None):
+        """
+        Máscara de colisão (pygame.Mask) de um frame, calculada uma única vez.
+
+        As máscaras ficam junto dos frames compartilhados, então todas as instâncias da mesma
+        animação reaproveitam o mesmo cálculo; como o cache de transformações, é um LRU limitado a
+        MASK_CACHE_SIZE. Parâmetros e deslocamento iguais aos de `get_frame_at`.
+        """
+        if flipped is None:
+            flipped = self.flipped
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+            if size == (self.max_width, self.max_height):
+                size = None
+
+        key = (index, flipped, size)
+        masks = self.masks
+        cached = masks.get(key)
+        if cached is not None:
+            masks.move_to_end(key)
+            return cached
+
+        frame, offset = self.get_frame_at(index, size, flipped)
+        cached = masks[key] = (pygame.mask.from_surface(frame), offset)
+        if len(masks) > self.MASK_CACHE_SIZE:
+            masks.popitem(last=False)
+        return cached
+
+    def get_frame_at(self, index, size=None, flipped=None):
+        """
+        Retorna um frame específico já transformado, reaproveitando o resultado entre chamadas.
+
+        O frame é recortado; o deslocamento indica onde desenhá-lo dentro do quadro completo
+        da animação (max_width x max_height, ou `size` quando escalado).
+
+        :param index: Índice do frame.
+        :param size: Tamanho final do quadro completo (largura, altura) ou None para manter o original.
+        :param flipped: Espelhamento horizontal; None usa o estado atual da animação.
+        :return: (superfície, (x, y))
+        """
+        if flipped is None:
+            flipped = self.flipped
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+            if size == (self.max_width, self.max_height):
+                size = None
+        if not flipped and size is None:
+            return self.frames[index], self.offsets[index]
+
+        key = (index, flipped, size)
+        cached = self.transform_cache.get(key)
+        if cached is not None:
+            self.transform_hits += 1
+            self.transform_cache.move_to_end(key)
+            return cached
+
+        self.transform_misses += 1
+        frame = self.frames[index]
+        x, y = self.offsets[index]
+        width, height = frame.get_size()
+        canvas_width = self.max_width
+        if size is not None:
+            # Escala as bordas (e não o tamanho) para manter o frame alinhado à base do quadro
+            scale_x = size[0] / self.max_width
+            scale_y = size[1] / self.max_height
+            left, right = round(x * scale_x), round((x + width) * scale_x)
+            top, bottom = round(y * scale_y), round((y + height) * scale_y)
+            x, y = left, top
+            frame = pygame.transform.scale(frame, (max(1, right - left), max(1, bottom - top)))
+            canvas_width = size[0]
+        if flipped:
             frame = pygame.transform.flip(frame, True, False)
-        return frame
+            x = canvas_width - x - frame.get_width()
+
+        cached = (frame, (x, y))
+        self.transform_cache[key] = cached
+        if len(self.transform_cache) > self.TRANSFORM_CACHE_SIZE:
+            self.transform_cache.popitem(last=False)
+        return cached
 
     def current_frame_index(self):
         """Retorna o índice do frame atual."""
@@ -100,4 +233,26 @@ class Animation:
     def reset(self):
         """Reinicia a animação."""
         self.current_frame = 0
-        self.animation_time = 0
\ No newline at end of file
+        self.animation_time = 0
+
+
+class AnimationDescriptor:
+    def __init__(self, spritesheet_path, json_path, **options):
+        """
+        Descreve uma animação sem carregá-la. O AnimationHandler cria a Animation na primeira vez que o estado é usado.
+
+        :param spritesheet_path: Caminho da spritesheet.
+        :param json_path: Caminho do JSON com os frames.
+        :param options: Demais argumentos de Animation (use_velocity, loop, animation_speed).
+        """
+        self.spritesheet_path = spritesheet_path
+        self.json_path = json_path
+        self.options = options
+
+    def build(self):
+        """Cria a animação descrita."""
+        return Animation(self.spritesheet_path, self.json_path, **self.options)
+
+    def prefetch(self):
+        """Aquece os frames em segundo plano."""
+        Animation.prefetch(self.spritesheet_path, self.json_path)
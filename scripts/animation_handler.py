@@ -1,24 +1,46 @@
+from scripts.animation import AnimationDescriptor
+
 class AnimationHandler:
-    def __init__(self, animations, default_animation="idle"):
+    def __init__(self, animations, default_animation="idle", prefetch=None):
         """
         Gerencia as animações do personagem.
 
-        :param animations: Dicionário de animações {nome: Animation}
+        :param animations: Dicionário de animações {nome: Animation ou AnimationDescriptor}.
+                           Descritores só são carregados quando o estado é selecionado pela primeira vez.
         :param default_animation: Animação inicial
+        :param prefetch: Dicionário {estado: [próximos estados prováveis]} aquecidos em segundo plano
+                         quando o estado é selecionado (ex.: {"walk": ["run"]}).
         """
-        self.animations = animations
-        self.current_animation = animations.get(default_animation, None)
+        self.animations = dict(animations)
+        self.prefetch_hints = prefetch or {}
+        self.current_animation = self.get_animation(default_animation)
         self.current_state = default_animation
         if self.current_animation is None:
             raise ValueError(f"A animação padrão '{default_animation}' não foi encontrada!")
         self.velocity = 0.1  # Velocidade inicial
+        self.prefetch_states(default_animation)
+
+    def get_animation(self, name):
+        """Retorna a animação do estado, carregando-a se ainda for apenas um descritor."""
+        animation = self.animations.get(name)
+        if isinstance(animation, AnimationDescriptor):
+            animation = self.animations[name] = animation.build()
+        return animation
+
+    def prefetch_states(self, name):
+        """Aquece em segundo plano as animações que costumam vir depois do estado `name`."""
+        for hint in self.prefetch_hints.get(name, ()):
+            animation = self.animations.get(hint)
+            if isinstance(animation, AnimationDescriptor):
+                animation.prefetch()
 
     def set_animation(self, name):
         """Muda a animação atual."""
-        if name in self.animations and self.current_animation != self.animations[name]:
-            self.current_animation = self.animations[name]
+        if name in self.animations and self.current_state != name:
+            self.current_animation = self.get_animation(name)
             self.current_animation.reset()
             self.current_state = name
+            self.prefetch_states(name)
 
     def updateState(self, velocity=0.1):
         """Atualiza a animação, levando em conta a velocidade caso necessário."""
@@ -28,9 +50,13 @@ class AnimationHandler:
             if self.current_animation.loop is False and self.current_animation.current_frame_index() == self.current_animation.frame_count() - 1:
                 self.set_animation("idle")
 
-    def get_sprite(self):
-        """Retorna o sprite da animação atual."""
-        return self.current_animation.get_frame() if self.current_animation else None
+    def get_sprite(self, size=None):
+        """Retorna (sprite, deslocamento) da animação atual, com o quadro opcionalmente escalado para `size`."""
+        return self.current_animation.get_frame(size) if self.current_animation else None
+
+    def get_mask(self, size=None):
+        """Retorna (máscara, deslocamento) do frame atual, para colisão por pixel."""
+        return self.current_animation.get_mask(size) if self.current_animation else None
 
     def get_current_animation(self):
         """Retorna o nome da animação atual."""
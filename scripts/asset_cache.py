@@ -0,0 +1,277 @@
+import os
+import json
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError
+import pygame
+
+from scripts.game_log import get_logger
+
+log = get_logger(__name__)
+
+
+class CacheEntry:
+    """Entrada do cache: o valor compartilhado, seu custo em memória e quantos donos o utilizam."""
+    __slots__ = ("key", "value", "size_bytes", "ref_count")
+
+    def __init__(self, key, value, size_bytes):
+        self.key = key
+        self.value = value
+        self.size_bytes = size_bytes
+        self.ref_count = 0
+
+
+class AnimationFrames:
+    """
+    Frames já processados de uma animação. Compartilhado e imutável entre instâncias de Animation.
+
+    Cada frame guarda só a área visível; `offsets` diz onde ele fica no quadro max_width x max_height.
+    `masks` guarda as máscaras de colisão já calculadas, compartilhadas como os frames.
+    """
+    __slots__ = ("frames", "max_width", "max_height", "offsets", "masks")
+
+    def __init__(self, frames, max_width, max_height, offsets):
+        self.frames = tuple(frames)
+        self.max_width = max_width
+        self.max_height = max_height
+        self.offsets = tuple(offsets)
+        self.masks = OrderedDict()  # (índice, espelhado, tamanho) -> (pygame.Mask, deslocamento), LRU (veja Animation.get_mask_at)
+
+    def padded_bytes(self):
+        """Memória que os frames ocupariam se fossem preenchidos até o tamanho máximo."""
+        return len(self.frames) * self.max_width * self.max_height * 4
+
+    def trimmed_bytes(self):
+        """Memória ocupada pelos frames recortados."""
+        return sum(frame.get_width() * frame.get_height() * 4 for frame in self.frames)
+
+
+def surface_bytes(surface):
+    """Estimativa de memória ocupada pelos pixels de uma superfície."""
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+class AssetCache:
+    def __init__(self, memory_budget=64 * 1024 * 1024):
+        """
+        Cache de assets compartilhado por todo o processo.
+
+        As entradas são indexadas pelo caminho dos arquivos mais o seu mtime, então um arquivo
+        alterado em disco gera uma nova chave. O mtime é lido uma vez por caminho e relido depois
+        de `refresh()`, chamado a cada carregamento de cena (SceneLoader): um arquivo alterado
+        durante a partida é recarregado na próxima cena. Entradas em uso (ref_count > 0) nunca são descartadas;
+        as demais saem em ordem LRU quando o orçamento de memória é excedido.
+
+        :param memory_budget: Limite (em bytes) de memória de pixels mantida no cache.
+        """
+        self.memory_budget = memory_budget
+        self.entries = OrderedDict()
+        self.memory_used = 0
+        self.hits = 0
+        self.misses = 0
+        self._mtimes = {}
+        self._loading = {}  # chave -> Event das entradas sendo construídas neste momento
+        self._lock = threading.RLock()
+        self._executor = None
+        self._conversions = deque()  # (superfície, Future) esperando convert_alpha na thread principal
+
+    def file_key(self, path):
+        """
+        Retorna (caminho absoluto, mtime). O stat é feito uma única vez por caminho até o próximo
+        `refresh()`; as checagens de validade do atlas e do pacote também usam este mtime.
+        """
+        path = os.path.abspath(path)
+        mtime = self._mtimes.get(path)
+        if mtime is None:
+            mtime = os.stat(path).st_mtime_ns
+            self._mtimes[path] = mtime
+        return path, mtime
+
+    def refresh(self):
+        """Esquece os mtimes memorizados para que arquivos alterados em disco sejam recarregados."""
+        with self._lock:
+            self._mtimes.clear()
+
+    def load_image(self, path):
+        """
+        Carrega (ou reutiliza) uma imagem com `convert_alpha`. Não mantém referência: pode ser descartada.
+
+        Pode ser chamado de qualquer thread: o PNG é decodificado na thread que pediu, e só o
+        `convert_alpha` (que mexe no estado do display) é feito na thread principal.
+        """
+        def build():
+            surface = self.convert_alpha(pygame.image.load(path))
+            return surface, surface_bytes(surface)
+        return self._get_or_build(("image", self.file_key(path)), build, reference=False)
+
+    def convert_alpha(self, surface):
+        """
+        `surface.convert_alpha()` sempre na thread principal.
+
+        De outra thread, o pedido entra numa fila atendida por `run_conversions` (a cada frame e
+        enquanto a thread principal espera por assets). Se a thread principal já terminou (saída do
+        jogo), a superfície volta sem conversão.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return surface.convert_alpha()
+
+        request = (surface, Future())
+        with self._lock:
+            self._conversions.append(request)
+        while True:
+            try:
+                return request[1].result(timeout=0.05)
+            except TimeoutError:
+                if threading.main_thread().is_alive():
+                    continue
+                with self._lock:
+                    if request in self._conversions:
+                        self._conversions.remove(request)
+                        return surface
+                # A thread principal pegou o pedido antes de terminar: o resultado já vem
+
+    def run_conversions(self):
+        """Converte as superfícies pedidas por outras threads. Só deve ser chamado na thread principal."""
+        while True:
+            with self._lock:
+                if not self._conversions:
+                    return
+                surface, future = self._conversions.popleft()
+            try:
+                future.set_result(surface.convert_alpha())
+            except Exception as e:
+                future.set_exception(e)
+
+    def load_json(self, path):
+        """Carrega (ou reutiliza) o conteúdo de um JSON. O resultado não deve ser modificado."""
+        def build():
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file), 0
+        return self._get_or_build(("json", self.file_key(path)), build, reference=False)
+
+    def acquire(self, kind, paths, builder):
+        """
+        Obtém um valor compartilhado, construindo-o apenas na primeira vez.
+
+        :param kind: Nome do tipo de asset (faz parte da chave).
+        :param paths: Arquivos de origem; seus caminhos e mtimes formam a chave.
+        :param builder: Função sem argumentos que retorna (valor, tamanho_em_bytes).
+        :return: (chave, valor). A chave deve ser devolvida em `release()` quando o dono for descartado.
+        """
+        key = (kind,) + tuple(self.file_key(path) for path in paths)
+        return key, self._get_or_build(key, builder, reference=True)
+
+    def prefetch(self, kind, paths, builder):
+        """Aquece um asset em segundo plano, sem manter referência a ele. Não faz nada se já estiver no cache."""
+        key = (kind,) + tuple(self.file_key(path) for path in paths)
+        with self._lock:
+            if key in self.entries or key in self._loading:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="asset-prefetch")
+        self._executor.submit(self._prefetch, kind, paths, builder)
+
+    def _prefetch(self, kind, paths, builder):
+        try:
+            key, _ = self.acquire(kind, paths, builder)
+            self.release(key)
+        except Exception as e:
+            log.warning("⚠️ Erro ao pré-carregar %s: %s", paths, e, exc_info=True)
+
+    def release(self, key):
+        """Devolve uma referência obtida com `acquire()`."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.ref_count > 0:
+                entry.ref_count -= 1
+                self._evict()
+
+    def clear(self):
+        """Remove todas as entradas que não estão em uso."""
+        with self._lock:
+            for key in [key for key, entry in self.entries.items() if entry.ref_count == 0]:
+                self.memory_used -= self.entries.pop(key).size_bytes
+
+    def stats(self):
+        """Resumo do estado do cache."""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "memory_used": self.memory_used,
+                "memory_budget": self.memory_budget,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _get_or_build(self, key, builder, reference):
+        """Retorna o valor da chave, construindo-o uma única vez mesmo com várias threads pedindo ao mesmo tempo."""
+        while True:
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    if reference:
+                        entry.ref_count += 1
+                    return entry.value
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = threading.Event()
+                    break
+            # Outra thread já está construindo este asset: espera e reaproveita o resultado
+            self.wait_for(loading.wait)
+
+        # A construção acontece fora do lock para não bloquear quem pede outros assets
+        try:
+            value, size_bytes = builder()
+            with self._lock:
+                entry = self._store(key, value, size_bytes)
+                if reference:
+                    entry.ref_count += 1
+                self._evict()
+            return value
+        finally:
+            with self._lock:
+                del self._loading[key]
+            loading.set()
+
+    def wait_for(self, wait, interval=0.005):
+        """
+        Espera `wait(timeout)` retornar verdadeiro. Na thread principal, atende as conversões
+        enquanto espera, já que a thread que ela aguarda pode depender de uma.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            wait(None)
+            return
+        while not wait(interval):
+            self.run_conversions()
+        self.run_conversions()
+
+    def _lookup(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def _store(self, key, value, size_bytes):
+        entry = CacheEntry(key, value, size_bytes)
+        self.entries[key] = entry
+        self.memory_used += size_bytes
+        return entry
+
+    def _evict(self):
+        """Descarta as entradas menos usadas recentemente e sem donos até caber no orçamento."""
+        if self.memory_used <= self.memory_budget:
+            return
+        for key in list(self.entries):
+            entry = self.entries[key]
+            if entry.ref_count == 0:
+                del self.entries[key]
+                self.memory_used -= entry.size_bytes
+                if self.memory_used <= self.memory_budget:
+                    break
+
+
+asset_cache = AssetCache()  # Instância global compartilhada por todas as animações
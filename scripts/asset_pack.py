@@ -0,0 +1,205 @@
+import os
+import sys
+import json
+import mmap
+import struct
+import threading
+import pygame
+
+ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT_PATH)
+
+from scripts.asset_cache import asset_cache, AnimationFrames
+from scripts.game_log import get_logger
+
+MANIFEST_PATH = os.path.join(ROOT_PATH, "assets", "animations", "manifest.json")
+PACK_PATH = os.path.join(ROOT_PATH, "assets", "build", "assets.pack")
+
+MAGIC = b"PFPK"
+VERSION = 2
+HEADER = struct.Struct("<4sIII")  # magic, versão, tamanho do índice JSON, início dos pixels
+ALIGNMENT = 16
+PIXEL_FORMAT = "BGRA"  # Mesmo layout de convert_alpha(): as superfícies não precisam de conversão
+
+log = get_logger(__name__)
+
+
+def relative_path(path):
+    """Caminho relativo à raiz do projeto, usado como chave dentro do pacote."""
+    return os.path.relpath(os.path.abspath(path), ROOT_PATH).replace(os.sep, "/")
+
+
+def animation_key(spritesheet_path, json_path):
+    return f"{relative_path(spritesheet_path)}|{relative_path(json_path)}"
+
+
+class AssetPack:
+    def __init__(self, path=PACK_PATH):
+        """
+        Pacote binário com os frames já recortados de todas as animações.
+
+        O arquivo é aberto com `mmap` e as superfícies são criadas diretamente sobre o buffer
+        com `pygame.image.frombuffer`, sem decodificar PNG nem redesenhar frames.
+        Entradas cujos arquivos de origem mudaram (mtime diferente) são ignoradas, e quem chamou
+        volta a carregar os arquivos soltos.
+
+        :param path: Caminho do pacote gerado por `python -m scripts.asset_pack`.
+        """
+        self.path = path
+        self.index = None
+        self._lock = threading.Lock()  # Threads de carregamento podem abrir o pacote ao mesmo tempo
+        self._file = None
+        self._buffer = None
+        self._data_offset = 0
+
+    def open(self):
+        """
+        Abre o pacote (uma única vez). Retorna False se ele não existir ou for inválido.
+
+        O índice só é publicado depois de lido por inteiro; outra thread que chegue durante a
+        abertura espera, em vez de ver um índice vazio e voltar aos PNGs soltos.
+        """
+        index = self.index
+        if index is not None:
+            return bool(index)
+
+        with self._lock:
+            if self.index is None:
+                self.index = self._read_index()
+            return bool(self.index)
+
+    def _read_index(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        self._file = open(self.path, "rb")
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_size, self._data_offset = HEADER.unpack_from(self._buffer, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Pacote de assets inválido: {self.path}")
+            return json.loads(self._buffer[HEADER.size:HEADER.size + index_size])
+        except (ValueError, struct.error) as e:
+            log.warning("⚠️ Ignorando pacote de assets: %s", e)
+            self.close()
+            return {}
+
+    def close(self):
+        """Fecha o arquivo. Superfícies já criadas mantêm o buffer vivo até serem descartadas."""
+        self._buffer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def is_fresh(self, sources):
+        """Verifica se os arquivos de origem ainda têm o mesmo mtime registrado no pacote."""
+        for path, mtime in sources.items():
+            try:
+                if asset_cache.file_key(os.path.join(ROOT_PATH, path))[1] != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def load_animation(self, spritesheet_path, json_path):
+        """Retorna os frames empacotados da animação, ou None se ela não estiver no pacote ou estiver desatualizada."""
+        if not self.open():
+            return None
+
+        entry = self.index["animations"].get(animation_key(spritesheet_path, json_path))
+        if entry is None or not self.is_fresh(entry["sources"]):
+            return None
+
+        view = memoryview(self._buffer)[self._data_offset:]
+        frames = [
+            pygame.image.frombuffer(view[offset:offset + width * height * 4], (width, height), PIXEL_FORMAT)
+            for offset, width, height, _, _ in entry["frames"]
+        ]
+        offsets = [(x, y) for _, _, _, x, y in entry["frames"]]
+        return AnimationFrames(frames, entry["max_width"], entry["max_height"], offsets)
+
+
+def build_pack(manifest_path=MANIFEST_PATH, output_path=PACK_PATH):
+    """
+    Gera o pacote binário a partir do manifesto de animações.
+
+    Layout: cabeçalho fixo (magic, versão, tamanho do índice, início dos pixels), índice JSON
+    e, alinhados em 16 bytes, os pixels BGRA de cada frame recortado. Cada frame do índice é
+    [início dos pixels, largura, altura, deslocamento x, deslocamento y], com o início relativo
+    à área de pixels.
+    """
+    from scripts.animation import Animation
+
+    with open(manifest_path, "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+
+    animations = {}
+    blobs = []
+    offset = 0
+    for item in manifest:
+        sheet_path = os.path.join(ROOT_PATH, item["sheet"])
+        json_path = os.path.join(ROOT_PATH, item["frames"])
+        animation = Animation.decode_frames(sheet_path, json_path)
+
+        frames = []
+        for frame, (x, y) in zip(animation.frames, animation.offsets):
+            data = pygame.image.tobytes(frame, PIXEL_FORMAT)
+            frames.append([offset, frame.get_width(), frame.get_height(), x, y])
+            padding = -len(data) % ALIGNMENT
+            blobs.append(data + b"\0" * padding)
+            offset += len(data) + padding
+
+        animations[animation_key(sheet_path, json_path)] = {
+            "sources": {relative_path(path): os.stat(path).st_mtime_ns for path in (sheet_path, json_path)},
+            "max_width": animation.max_width,
+            "max_height": animation.max_height,
+            "frames": frames,
+        }
+        print(f"📦 {item['frames']}: {len(frames)} frames")
+
+    index = json.dumps({"animations": animations}).encode("utf-8")
+    padding = -(HEADER.size + len(index)) % ALIGNMENT
+    data_offset = HEADER.size + len(index) + padding
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(index), data_offset))
+        file.write(index)
+        file.write(b" " * padding)
+        for blob in blobs:
+            file.write(blob)
+    os.replace(temp_path, output_path)
+    print(f"✅ Pacote gerado: {output_path} ({os.path.getsize(output_path) // 1024} KiB)")
+
+
+def memory_report(manifest_path=MANIFEST_PATH):
+    """Mostra, por animação, a memória dos frames com bordas transparentes e dos frames recortados."""
+    from scripts.animation import Animation
+
+    with open(manifest_path, "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+
+    total_padded = total_trimmed = 0
+    print(f"{'animação':<48} {'com bordas':>12} {'recortado':>12} {'economia':>9}")
+    for item in manifest:
+        animation = Animation.decode_frames(os.path.join(ROOT_PATH, item["sheet"]), os.path.join(ROOT_PATH, item["frames"]))
+        padded, trimmed = animation.padded_bytes(), animation.trimmed_bytes()
+        total_padded += padded
+        total_trimmed += trimmed
+        print(f"{item['frames']:<48} {padded:>12,} {trimmed:>12,} {1 - trimmed / padded:>9.0%}")
+    print(f"{'total':<48} {total_padded:>12,} {total_trimmed:>12,} {1 - total_trimmed / total_padded:>9.0%}")
+
+
+asset_pack = AssetPack()  # Instância global usada por Animation
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    if len(sys.argv) > 1 and sys.argv[1] == "report":
+        memory_report()
+    else:
+        build_pack()
+    pygame.quit()
@@ -3,9 +3,12 @@ from scripts.animation_handler import AnimationHandler
 from scripts.gravity_component import GravityComponent
 from scripts.collision_component import CollisionComponent
 from scripts.objects import Object
+from scripts.component_store import Column
 
 class Car(Object):
-    def __init__(self, x, y, animations, width=0, height=0, use_gravity=False, use_collision=False):
+    velocity_x = Column("vx")
+
+    def __init__(self, x, y, animations, width=0, height=0, use_gravity=False, use_collision=False, pixel_perfect=False):
         """
         Classe para carros que herdam de Object e são afetados pelo efeito de parallax.
 
@@ -16,8 +19,9 @@ class Car(Object):
         :param height: Altura do objeto (usado para colisão)
         :param use_gravity: Define se o objeto será afetado pela gravidade
         :param use_collision: Define se o objeto terá colisão ativa
+        :param pixel_perfect: Colisão confirmada pelos pixels visíveis do sprite
         """
-        super().__init__(x, y, animations, width, height, use_gravity, use_collision)
+        super().__init__(x, y, animations, width, height, use_gravity, use_collision, pixel_perfect=pixel_perfect)
         self.velocity_x = 0  # Velocidade horizontal do carro
 
     def move(self, dx):
@@ -5,10 +5,20 @@ from scripts.gravity_component import GravityComponent
 from scripts.collision_component import CollisionComponent
 
 class Character(Object):
-    def __init__(self, x, y, width, height, animations, use_gravity=False, min_y=0, max_y=0, speed=5):
-        super().__init__(x=x, y=y, width=width, height=height, animations=animations, use_gravity=use_gravity, use_collision=True)
-        self.width = width * animations["idle"].max_width
-        self.height = height * animations["idle"].max_height
+    # Dados de cada personagem como atributos de classe, para o CharacterRegistry lê-los sem instanciar
+    NAME = None
+    STATS = {}  # Ex.: {"speed": 5, "health": 100, ...}; copiados para a instância
+    SIZE = 1  # Escala do sprite
+    ANIMATIONS = {}  # {estado: AnimationDescriptor}; "idle" é a prévia da seleção de personagem
+    PREFETCH = {}  # Estados carregados em segundo plano após cada estado (veja AnimationHandler)
+
+    def __init__(self, x, y, width, height, animations, use_gravity=False, min_y=0, max_y=0, speed=5, animation_prefetch=None, pixel_perfect=False):
+        super().__init__(x=x, y=y, width=width, height=height, animations=animations, use_gravity=use_gravity, use_collision=True, animation_prefetch=animation_prefetch, pixel_perfect=pixel_perfect)
+        idle_animation = self.animation_handler.get_animation("idle")
+        self.width = width * idle_animation.max_width
+        self.height = height * idle_animation.max_height
+        # A caixa de colisão tem o tamanho desenhado, não a escala recebida
+        self.collision_component.set_size(self.width, self.height)
         self.velocity_x = 0
         self.velocity_y = 0
         self.walk_speed = speed
@@ -76,15 +86,24 @@ class Character(Object):
                 self.velocity_y = 0
                 self.jump_cooldown = 10  # 🔥 Pequeno cooldown para evitar spam de pulo
 
-        self.control(pygame.key.get_pressed())
+        self.control(params["pressed_keys"])
 
-        for obj in params["collidables"]:
-            if obj.collision_component and obj is not self:
-                self.collision_component.resolve_collision(obj)
+        # Só os vizinhos nas células do hash espacial são testados
+        world = params["collision_world"]
+        component = self.collision_component
+        world.update(component)
+        for other in world.query(*component.aabb()):
+            if other is not component:
+                component.resolve_collision(other)
         
         if self.jump_cooldown > 0:
             self.jump_cooldown -= 1
 
+        # A animação avança junto com a simulação, não com a taxa de quadros
+        velocity_factor = max(abs(self.velocity_x), abs(self.velocity_y))
+        velocity_factor = min(0.15, velocity_factor / self.speed)
+        self.animation_handler.updateState(velocity_factor)
+
     def control(self, keys):
         """Controla o personagem."""
         dx, dy = 0, 0
@@ -107,32 +126,33 @@ class Character(Object):
 
     def set_position(self, x, y):
         """Define a posição do personagem."""
-        self.x = x
-        self.y = y
+        self.x = self.previous_x = x
+        self.y = self.previous_y = y
 
-    def draw(self, screen):
-        """Desenha o personagem na tela mantendo um tamanho fixo e alinhado pela base."""
-        sprite = self.animation_handler.get_sprite()
-        if sprite:
-            original_width, original_height = sprite.get_size()
+    def sprite_size(self):
+        """Tamanho do quadro desenhado: altura fixa, largura proporcional à animação atual."""
+        animation = self.animation_handler.current_animation
+        original_width, original_height = animation.max_width, animation.max_height
 
-            # Definir um tamanho fixo para altura
-            scale_factor = self.height / original_height  # Escala baseada na altura fixa
-            new_width = int(original_width * scale_factor)
-            new_height = self.height  # Mantém a altura fixa
+        # Definir um tamanho fixo para altura
+        scale_factor = self.height / original_height  # Escala baseada na altura fixa
+        return int(original_width * scale_factor), int(self.height)  # Mantém a altura fixa
 
-            scaled_sprite = pygame.transform.scale(sprite, (new_width, new_height))
+    def draw(self, screen, alpha=1.0, render_queue=None):
+        """Desenha o personagem na tela mantendo um tamanho fixo e alinhado pela base."""
+        if self.animation_handler.current_animation:
+            new_width, new_height = self.sprite_size()
+
+            scaled_sprite, (offset_x, offset_y) = self.animation_handler.get_sprite((new_width, new_height))
 
             # Fixar a base do personagem no mesmo Y
-            x_pos = self.x - new_width // 2
-            y_pos = self.y - new_height // 2
+            x, y = self.render_position(alpha)
+            x_pos = x - new_width // 2
+            y_pos = y - new_height // 2
 
-            screen.blit(scaled_sprite, (x_pos, y_pos))
+            self.submit_sprite(screen, scaled_sprite, (x_pos + offset_x, y_pos + offset_y), y + self.height / 2, render_queue)
 
     def late_update(self, params):
-        """Atualização tardia para ajustar a posição do personagem."""
-        velocity_factor = max(abs(self.velocity_x), abs(self.velocity_y))
-        velocity_factor = min(0.15, velocity_factor / self.speed)
-        self.animation_handler.updateState(velocity_factor)
-        self.draw(params["screen"])
+        """Desenha o personagem entre o passo anterior e o atual."""
+        self.draw(params["screen"], params.get("alpha", 1.0), params.get("render_queue"))
         
\ No newline at end of file
@@ -0,0 +1,175 @@
+import os
+import sys
+import json
+import importlib
+
+ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT_PATH)
+
+from scripts.animation import AnimationDescriptor
+from scripts.game_log import get_logger
+
+CHARACTERS_PATH = os.path.join(ROOT_PATH, "assets", "characters")
+CHARACTERS_PACKAGE = "assets.characters"
+INDEX_PATH = os.path.join(ROOT_PATH, "assets", "build", "characters.json")
+
+INDEX_VERSION = 2
+
+log = get_logger(__name__)
+
+
+class CharacterEntry:
+    __slots__ = ("name", "module", "class_name", "stats", "size", "preview")
+
+    def __init__(self, name, module, class_name, stats, size, preview):
+        """
+        Um personagem do índice, sem instanciá-lo nem carregar seus sprites.
+
+        :param name: Character.NAME em maiúsculas (o mesmo salvo em settings.json, ex.: "BLAZE").
+        :param module: Módulo que define a classe (ex.: "assets.characters.blaze").
+        :param class_name: Nome da classe.
+        :param stats: Atributos do personagem (Character.STATS).
+        :param size: Escala do sprite (Character.SIZE).
+        :param preview: Animação "idle": {"spritesheet_path", "json_path", "options"}.
+        """
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+        self.stats = stats
+        self.size = size
+        self.preview = preview
+
+    def preview_descriptor(self):
+        """AnimationDescriptor da animação "idle", usada na seleção de personagem."""
+        return AnimationDescriptor(self.preview["spritesheet_path"], self.preview["json_path"], **self.preview["options"])
+
+    def to_json(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class CharacterRegistry:
+    def __init__(self, characters_path=CHARACTERS_PATH, package=CHARACTERS_PACKAGE, index_path=INDEX_PATH):
+        """
+        Índice dos personagens jogáveis.
+
+        A pasta é examinada uma vez por execução. O índice (nome, classe, atributos, escala e a
+        animação "idle" de cada personagem) fica salvo em JSON e só é refeito quando o mtime de
+        algum arquivo da pasta muda; enquanto isso, nenhum módulo de personagem é importado.
+        A classe só é importada, e o personagem só é criado, quando ele é escolhido ou jogado.
+
+        :param characters_path: Pasta com um módulo por personagem.
+        :param package: Pacote Python correspondente à pasta.
+        :param index_path: Arquivo do índice salvo.
+        """
+        self.characters_path = characters_path
+        self.package = package
+        self.index_path = index_path
+        self._entries = None
+
+    def entries(self):
+        """Personagens disponíveis, na ordem dos arquivos."""
+        if self._entries is None:
+            self._entries = self.load_index()
+        return self._entries
+
+    def find(self, name):
+        """Entrada do personagem pelo nome (sem diferenciar maiúsculas), ou None."""
+        if not name:
+            return None
+        name = name.upper()
+        return next((entry for entry in self.entries() if entry.name == name), None)
+
+    def get_class(self, name):
+        """Classe do personagem (importando o módulo só agora, se preciso)."""
+        entry = self.find(name)
+        if entry is None:
+            return None
+        return getattr(importlib.import_module(entry.module), entry.class_name)
+
+    def create(self, name, **kwargs):
+        """Cria o personagem `name`; retorna None se ele não existir."""
+        character_class = self.get_class(name)
+        if character_class is None:
+            return None
+        log.info("🔵 Criando personagem: %s", name)
+        return character_class(**kwargs)
+
+    def sources(self):
+        """{arquivo: mtime} dos módulos de personagem."""
+        if not os.path.exists(self.characters_path):
+            log.warning("⚠️ Pasta de personagens não encontrada!")
+            return {}
+        return {
+            file: os.stat(os.path.join(self.characters_path, file)).st_mtime_ns
+            for file in sorted(os.listdir(self.characters_path))
+            if file.endswith(".py") and file != "__init__.py"
+        }
+
+    def load_index(self):
+        """Lê o índice salvo; refaz se algum arquivo mudou."""
+        sources = self.sources()
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                index = json.load(file)
+            if index.get("version") == INDEX_VERSION and index.get("sources") == sources:
+                return [CharacterEntry(**entry) for entry in index["characters"]]
+        except (OSError, ValueError, TypeError):
+            pass
+
+        entries = self.scan(sources)
+        self.save_index(sources, entries)
+        return entries
+
+    def scan(self, sources):
+        """
+        Importa cada módulo de personagem e lê os atributos de classe, sem instanciar nada.
+
+        Um módulo que não importa, ou uma classe com atributos incompletos (ex.: sem animação
+        "idle"), é pulado com um aviso; os outros personagens continuam no índice.
+        """
+        from scripts.character import Character
+
+        entries = []
+        for file in sources:
+            module_name = f"{self.package}.{file[:-3]}"
+            log.debug("🔵 Importando personagem: %s", module_name)
+            try:
+                module = importlib.import_module(module_name)
+            except Exception as e:
+                log.warning("⚠️ Erro ao importar %s: %s", module_name, e)
+                continue
+
+            for attr, obj in vars(module).items():
+                if (isinstance(obj, type) and issubclass(obj, Character) and obj is not Character
+                        and obj.__module__ == module.__name__):
+                    try:
+                        entries.append(self.entry(module_name, attr, obj))
+                    except Exception as e:
+                        log.warning("⚠️ Personagem %s.%s ignorado: %r", module_name, attr, e)
+        return entries
+
+    @staticmethod
+    def entry(module_name, class_name, character_class):
+        """CharacterEntry com os atributos de classe de `character_class` (nome: NAME ou o da classe)."""
+        idle = character_class.ANIMATIONS["idle"]
+        return CharacterEntry(
+            name=(character_class.NAME or class_name).upper(),
+            module=module_name,
+            class_name=class_name,
+            stats=dict(character_class.STATS),
+            size=character_class.SIZE,
+            preview={"spritesheet_path": idle.spritesheet_path, "json_path": idle.json_path, "options": dict(idle.options)},
+        )
+
+    def save_index(self, sources, entries):
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            temp_path = f"{self.index_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"version": INDEX_VERSION, "sources": sources, "characters": [entry.to_json() for entry in entries]}, file, indent=2)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            log.warning("⚠️ Não foi possível gravar o índice de personagens: %s", e)
+
+
+character_registry = CharacterRegistry()
@@ -1,15 +1,60 @@
+import pygame
+
+
 class CollisionComponent:
-    def __init__(self, owner, width, height):
+    def __init__(self, owner, width, height, pixel_perfect=False):
         """
         Componente de colisão para impedir atravessamento de objetos.
 
         :param owner: Referência ao objeto que possui este componente.
         :param width: Largura do objeto.
         :param height: Altura do objeto.
+        :param pixel_perfect: Depois do teste de caixas, confirma a colisão pelas máscaras dos sprites
+                              (pixels visíveis), em vez de considerar a caixa inteira como sólida.
         """
         self.owner = owner
+        self.set_size(width, height)
+        self.pixel_perfect = pixel_perfect
+        self.box_masks = {}  # (largura, altura) -> máscara cheia, para comparar com quem não usa pixels
+
+    def set_size(self, width, height):
+        """Define o tamanho da caixa, centrada no dono (as metades ficam guardadas para as consultas)."""
         self.width = width
         self.height = height
+        self.half_width = width // 2
+        self.half_height = height // 2
+
+    def aabb(self):
+        """
+        Caixa de colisão (esquerda, topo, largura, altura), usada pelo CollisionWorld.
+
+        Mesmo referencial do desenho: centrada em (owner.x, owner.y). Com `pixel_perfect`, é o
+        retângulo da máscara do frame atual (veja `shape`), então a caixa e o teste por pixel sempre
+        comparam a mesma área.
+        """
+        if self.pixel_perfect:
+            _, left, top, width, height = self.shape()
+            return left, top, width, height
+        owner, width, height = self.owner, self.width, self.height
+        return owner.x - self.half_width, owner.y - self.half_height, width, height
+
+    def shape(self):
+        """
+        (máscara ou None, esquerda, topo, largura, altura) da área sólida na tela.
+
+        Com `pixel_perfect`, a máscara do frame atual do dono (veja `Object.collision_mask`): o
+        quadro de `sprite_size()` centrado em (x, y), mais o deslocamento do recorte. Sem ela, a
+        caixa width × height centrada em (x, y), sem máscara.
+        """
+        owner = self.owner
+        if self.pixel_perfect:
+            sprite_mask = owner.collision_mask()
+            if sprite_mask is not None:
+                mask, (left, top) = sprite_mask
+                width, height = mask.get_size()
+                return mask, left, top, width, height
+        width, height = self.width, self.height
+        return None, owner.x - self.half_width, owner.y - self.half_height, width, height
 
     def check_collision(self, other):
         """
@@ -21,12 +66,50 @@ class CollisionComponent:
         if not isinstance(other, CollisionComponent):
             return False
 
-        return (
-            self.owner.x < other.owner.x + other.width and
-            self.owner.x + self.width > other.owner.x and
-            self.owner.y < other.owner.y + other.height and
-            self.owner.y + self.height > other.owner.y
-        )
+        # Teste barato das caixas primeiro; as máscaras só são comparadas se as caixas se tocarem
+        if self.pixel_perfect:
+            mask, x, y, width, height = self.shape()
+        else:
+            owner, mask, width, height = self.owner, None, self.width, self.height
+            x, y = owner.x - self.half_width, owner.y - self.half_height
+        if other.pixel_perfect:
+            other_mask, other_x, other_y, other_width, other_height = other.shape()
+        else:
+            owner, other_mask, other_width, other_height = other.owner, None, other.width, other.height
+            other_x, other_y = owner.x - other.half_width, owner.y - other.half_height
+        if not (
+            x < other_x + other_width and
+            x + width > other_x and
+            y < other_y + other_height and
+            y + height > other_y
+        ):
+            return False
+
+        if mask is None and other_mask is None:
+            return True
+
+        if mask is None:
+            mask = self.box_mask(width, height)
+        if other_mask is None:
+            other_mask = other.box_mask(other_width, other_height)
+        return mask.overlap(other_mask, (round(other_x - x), round(other_y - y))) is not None
+
+    def mask(self):
+        """
+        Máscara usada no teste por pixel e a posição do seu canto na tela (o mesmo de `aabb`).
+
+        Usa a máscara do frame atual do dono; sem ela, uma máscara cheia da caixa de colisão.
+        """
+        mask, left, top, width, height = self.shape()
+        return (mask if mask is not None else self.box_mask(width, height)), (left, top)
+
+    def box_mask(self, width, height):
+        """Máscara cheia do tamanho da caixa, para comparar com quem usa pixels."""
+        size = (max(1, int(width)), max(1, int(height)))
+        box_mask = self.box_masks.get(size)
+        if box_mask is None:
+            box_mask = self.box_masks[size] = pygame.Mask(size, fill=True)
+        return box_mask
 
     def resolve_collision(self, other):
         """
@@ -37,4 +120,6 @@ class CollisionComponent:
         if self.check_collision(other):
             if self.owner.gravity_component:  # Se o objeto tem gravidade, impede a queda
                 self.owner.gravity_component.reset_velocity()
-                self.owner.y = other.owner.y - self.height  # Mantém o objeto acima do chão
\ No newline at end of file
+                _, _, top, _, height = self.shape()
+                _, _, other_top, _, _ = other.shape()
+                self.owner.y += other_top - (top + height)  # Apoia a base do objeto no topo do outro
\ No newline at end of file
@@ -0,0 +1,106 @@
+from math import floor
+
+
+class CollisionWorld:
+    def __init__(self, cell_size=256):
+        """
+        Broadphase de colisão com hash espacial em grade uniforme.
+
+        Cada `CollisionComponent` registrado fica nas células que sua caixa (`aabb()`, centrada no
+        dono) toca. Consultas olham só as células da área pedida, então cada objeto testa apenas os
+        vizinhos próximos.
+        `update` move o componente de célula só quando a faixa de células ocupada muda.
+
+        Os componentes são guardados em dicionários (ordem de inserção), não em conjuntos, para que
+        a ordem das consultas seja a mesma em toda execução (o replay depende disso).
+
+        :param cell_size: Lado de cada célula, em pixels. Bom valor: um pouco maior que os objetos típicos (o jipe tem 205 px).
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # (cx, cy) -> {componente: None}
+        self.ranges = {}  # componente -> (cx0, cy0, cx1, cy1) das células ocupadas
+
+    def cell_range(self, x, y, width, height):
+        size = self.cell_size
+        return (floor(x / size), floor(y / size), floor((x + width) / size), floor((y + height) / size))
+
+    def register(self, component):
+        """Adiciona um componente ao mundo (ignorado se já estiver registrado)."""
+        if component not in self.ranges:
+            cell_range = self.cell_range(*component.aabb())
+            self.ranges[component] = cell_range
+            self._insert(component, cell_range)
+
+    def unregister(self, component):
+        """Remove um componente do mundo."""
+        cell_range = self.ranges.pop(component, None)
+        if cell_range is not None:
+            self._remove(component, cell_range)
+
+    def update(self, component):
+        """Atualiza as células de um componente que se moveu (registrando-o se preciso)."""
+        old_range = self.ranges.get(component)
+        if old_range is None:
+            self.register(component)
+            return
+        new_range = self.cell_range(*component.aabb())
+        if new_range != old_range:
+            self._remove(component, old_range)
+            self._insert(component, new_range)
+            self.ranges[component] = new_range
+
+    def query(self, x, y, width, height):
+        """Componentes cuja caixa se sobrepõe ao retângulo (x, y, largura, altura)."""
+        size = self.cell_size
+        cx0, cx1 = floor(x / size), floor((x + width) / size)
+        cy0, cy1 = floor(y / size), floor((y + height) / size)
+        cells = self.cells
+        if cx0 == cx1 and cy0 == cy1:
+            found = cells.get((cx0, cy0), ())
+        else:
+            found = {}
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    cell = cells.get((cx, cy))
+                    if cell:
+                        found.update(cell)
+
+        # Teste exato das caixas, com a mesma caixa de CollisionComponent.check_collision
+        right, bottom = x + width, y + height
+        hits = []
+        for component in found:
+            if component.pixel_perfect:
+                left, top, component_width, component_height = component.aabb()
+            else:
+                owner = component.owner
+                component_width, component_height = component.width, component.height
+                left, top = owner.x - component.half_width, owner.y - component.half_height
+            if left < right and left + component_width > x and top < bottom and top + component_height > y:
+                hits.append(component)
+        return hits
+
+    def clear(self):
+        self.cells.clear()
+        self.ranges.clear()
+
+    def __len__(self):
+        return len(self.ranges)
+
+    def __contains__(self, component):
+        return component in self.ranges
+
+    def _insert(self, component, cell_range):
+        cx0, cy0, cx1, cy1 = cell_range
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), {})[component] = None
+
+    def _remove(self, component, cell_range):
+        cx0, cy0, cx1, cy1 = cell_range
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(component, None)
+                    if not cell:
+                        del self.cells[(cx, cy)]
@@ -0,0 +1,140 @@
+import weakref
+import numpy as np
+
+
+class Column:
+    """
+    Atributo que lê e escreve uma coluna do `ComponentStore` na linha do objeto.
+
+    O objeto precisa ter `store` e `row`. Os valores saem como `float` do Python, então o resto
+    do código (pygame, json, prints) continua vendo números comuns.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj.store.columns[self.name].item(obj.row)
+
+    def __set__(self, obj, value):
+        obj.store.columns[self.name][obj.row] = value
+
+
+class ComponentStore:
+    # Colunas numéricas e seus valores iniciais
+    DEFAULTS = {
+        "x": 0.0,
+        "y": 0.0,
+        "previous_x": 0.0,  # Posição no passo anterior, para interpolar o desenho
+        "previous_y": 0.0,
+        "vx": 0.0,
+        "vy": 0.0,
+        "gravity": 0.0,  # 0 = sem GravityComponent
+        "terminal_velocity": np.inf,
+        "lifetime": np.inf,  # Passos de vida; infinito = não expira
+        "age": 0.0,
+    }
+
+    def __init__(self, capacity=64):
+        """
+        Estado de simulação dos objetos em colunas NumPy (struct-of-arrays).
+
+        Cada objeto ocupa uma linha; `Object`, `Car`, `Jeep` e `GravityComponent` leem e escrevem
+        nela pelos atributos `Column`. Assim `step` move todos os carros de uma cena com algumas
+        operações vetorizadas, em vez de uma chamada de método por objeto.
+
+        Linhas de objetos coletados pelo GC voltam para a lista de livres automaticamente.
+
+        :param capacity: Linhas reservadas de início; a capacidade dobra quando acaba.
+        """
+        self.capacity = capacity
+        self.columns = {name: np.full(capacity, value, dtype=np.float64) for name, value in self.DEFAULTS.items()}
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.owners = [None] * capacity  # Linha -> weakref do objeto dono
+        self.free_rows = list(range(capacity - 1, -1, -1))
+
+    def allocate(self, owner, **values):
+        """Reserva uma linha para `owner`, com os valores iniciais dados (o resto fica no padrão)."""
+        if not self.free_rows:
+            self.grow()
+        row = self.free_rows.pop()
+        for name, value in values.items():
+            self.columns[name][row] = value
+        self.alive[row] = True
+        ref = self.owners[row] = weakref.ref(owner)
+        weakref.finalize(owner, self.release, row, ref)
+        return row
+
+    def release(self, row, ref=None):
+        """
+        Devolve a linha à lista de livres, com os valores padrão.
+
+        :param ref: Se dado, só libera se a linha ainda pertencer a esse weakref (evita liberar
+                    uma linha já reaproveitada por outro objeto).
+        """
+        if not self.alive[row] or (ref is not None and self.owners[row] is not ref):
+            return
+        for name, value in self.DEFAULTS.items():
+            self.columns[name][row] = value
+        self.alive[row] = False
+        self.owners[row] = None
+        self.free_rows.append(row)
+
+    def grow(self):
+        """Dobra a capacidade. Os objetos guardam só o número da linha, então nada precisa ser avisado."""
+        old_capacity, self.capacity = self.capacity, self.capacity * 2
+        for name, value in self.DEFAULTS.items():
+            column = np.full(self.capacity, value, dtype=np.float64)
+            column[:old_capacity] = self.columns[name]
+            self.columns[name] = column
+        self.alive = np.concatenate([self.alive, np.zeros(old_capacity, dtype=bool)])
+        self.owners.extend([None] * old_capacity)
+        self.free_rows.extend(range(self.capacity - 1, old_capacity - 1, -1))
+
+    def owner(self, row):
+        """Objeto dono da linha (ou None se já foi coletado)."""
+        ref = self.owners[row]
+        return ref() if ref is not None else None
+
+    def save_previous_positions(self, rows):
+        """Copia x/y para previous_x/previous_y nas linhas `rows`, antes de um passo de simulação."""
+        columns = self.columns
+        columns["previous_x"][rows] = columns["x"][rows]
+        columns["previous_y"][rows] = columns["y"][rows]
+
+    def step(self, rows, dt, delta_x=0):
+        """
+        Um passo de simulação para as linhas `rows` (array de índices), na mesma ordem do caminho
+        objeto a objeto (`GravityComponent.apply_gravity`, parallax de `Car.update`, `Car.move` e
+        tempo de vida de `Jeep.update`), para que os resultados sejam idênticos.
+
+        :return: Linhas cujo tempo de vida acabou.
+        """
+        rows = rows[self.alive[rows]]
+        if not rows.size:
+            return rows
+        columns = self.columns
+
+        # Gravidade
+        velocity_y = np.minimum(columns["vy"][rows] + columns["gravity"][rows] * dt, columns["terminal_velocity"][rows])
+        columns["vy"][rows] = velocity_y
+        columns["y"][rows] += velocity_y
+
+        # Parallax e movimento horizontal (somas separadas, como no caminho escalar)
+        x = columns["x"][rows]
+        x += delta_x
+        x += columns["vx"][rows]
+        columns["x"][rows] = x
+
+        # Tempo de vida
+        age = columns["age"][rows] + 1
+        columns["age"][rows] = age
+        return rows[age >= columns["lifetime"][rows]]
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+
+COMPONENT_STORE = ComponentStore()
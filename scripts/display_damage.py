@@ -0,0 +1,74 @@
+import pygame
+
+
+class DisplayDamage:
+    def __init__(self, screen_size, full_threshold=0.5):
+        """
+        Junta as regiões da tela alteradas no frame para atualizar só elas no display.
+
+        Inscritos com `REPORTS_DAMAGE = True` informam o que redesenharam com `add` (ou `mark_full`).
+        Se algum inscrito não informar, ou a área alterada passar de `full_threshold` da tela,
+        o frame inteiro é enviado com `display.flip()`.
+
+        :param screen_size: Tamanho da tela.
+        :param full_threshold: Fração da tela a partir da qual compensa atualizar tudo.
+        """
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.full_threshold = full_threshold
+        self.rects = []
+        self.full = True
+        self.drawn = set()  # Inscritos que já desenharam a tela inteira desde o último `invalidate`
+
+    def add(self, rect):
+        """Marca uma região como alterada."""
+        rect = self.screen_rect.clip(rect)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+
+    def mark_full(self):
+        """Marca a tela inteira como alterada."""
+        self.full = True
+
+    def invalidate(self):
+        """O conteúdo da tela deixou de valer (fade, troca de menu, overlay): todos redesenham tudo."""
+        self.drawn.clear()
+        self.full = True
+
+    def needs_redraw(self, owner):
+        """Indica se `owner` deve redesenhar a tela inteira neste frame (só retorna True uma vez)."""
+        if owner in self.drawn:
+            return False
+        self.drawn.add(owner)
+        self.full = True
+        return True
+
+    def redraw(self, screen, rects, draw):
+        """
+        Redesenha só a área que cobre `rects`: `draw()` roda com o clip da tela limitado a ela.
+
+        :param screen: Superfície da tela.
+        :param rects: Regiões alteradas (ex.: o retângulo antigo e o novo de um widget).
+        :param draw: Função que desenha a tela inteira.
+        """
+        rects = [rect for rect in rects if rect.width and rect.height]
+        if not rects:
+            return
+        area = self.screen_rect.clip(rects[0].unionall(rects[1:]))
+        screen.set_clip(area)
+        try:
+            draw()
+        finally:
+            screen.set_clip(None)
+        self.add(area)
+
+    def present(self):
+        """Envia ao display as regiões alteradas desde a última chamada."""
+        if not self.full:
+            area = sum(rect.width * rect.height for rect in self.rects)
+            self.full = area > self.screen_rect.width * self.screen_rect.height * self.full_threshold
+        if self.full:
+            pygame.display.flip()
+        elif self.rects:
+            pygame.display.update(self.rects)
+        self.rects = []
+        self.full = False
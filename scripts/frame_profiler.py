@@ -0,0 +1,120 @@
+from collections import deque
+from time import perf_counter_ns
+import pygame
+
+
+class RollingTimer:
+    """Guarda as últimas amostras de tempo (em nanossegundos) e calcula percentis sob demanda."""
+    __slots__ = ("samples",)
+
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)
+
+    def add(self, elapsed_ns):
+        self.samples.append(elapsed_ns)
+
+    def percentiles(self, *points):
+        """Retorna os percentis pedidos (0 a 100), em milissegundos."""
+        if not self.samples:
+            return tuple(0.0 for _ in points)
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return tuple(ordered[min(last, int(last * point / 100 + 0.5))] / 1e6 for point in points)
+
+
+class FrameProfiler:
+    def __init__(self, window=240, top_n=5, refresh_frames=15):
+        """
+        Mede o tempo de cada inscrito do EventManager e o tempo total de cada frame.
+
+        Desligado por padrão: enquanto `enabled` for False o EventManager não chama o profiler.
+
+        :param window: Quantidade de frames usada nos percentis.
+        :param top_n: Quantos inscritos mais caros aparecem no overlay.
+        :param refresh_frames: A cada quantos frames o texto do overlay é refeito.
+        """
+        self.enabled = False
+        self.window = window
+        self.top_n = top_n
+        self.refresh_frames = refresh_frames
+        self.frame_timer = RollingTimer(window)
+        self.interval_timer = RollingTimer(window)
+        self.timers = {}
+        self._frame_start = None
+        self._frames_since_refresh = 0
+        self._overlay = None
+
+    def toggle(self):
+        """Liga/desliga a medição e o overlay."""
+        self.enabled = not self.enabled
+        self.timers.clear()
+        self.frame_timer = RollingTimer(self.window)
+        self.interval_timer = RollingTimer(self.window)
+        self._frame_start = None
+        self._overlay = None
+
+    def record(self, obj, phase, elapsed_ns):
+        """Registra o tempo gasto por `obj` em uma fase (update ou late_update)."""
+        key = (type(obj).__name__, phase)
+        timer = self.timers.get(key)
+        if timer is None:
+            timer = self.timers[key] = RollingTimer(self.window)
+        timer.add(elapsed_ns)
+
+    def begin_frame(self):
+        """Marca o início de um frame; o intervalo entre dois inícios dá o FPS real."""
+        now = perf_counter_ns()
+        if self._frame_start is not None:
+            self.interval_timer.add(now - self._frame_start)
+        self._frame_start = now
+
+    def end_frame(self):
+        """Marca o fim do trabalho do frame (antes de esperar pelo clock)."""
+        if self._frame_start is not None:
+            self.frame_timer.add(perf_counter_ns() - self._frame_start)
+
+    def report(self):
+        """Resumo atual: percentis do frame e os inscritos mais caros, ordenados pelo p95."""
+        p50, p95, p99 = self.frame_timer.percentiles(50, 95, 99)
+        interval = self.interval_timer.percentiles(50)[0]
+        subscribers = sorted(
+            ((name, phase) + timer.percentiles(50, 95, 99) for (name, phase), timer in self.timers.items()),
+            key=lambda row: row[3],
+            reverse=True,
+        )
+        return {
+            "frame": (p50, p95, p99),
+            "fps": 1000 / interval if interval else 0.0,
+            "subscribers": subscribers[:self.top_n],
+        }
+
+    def draw(self, screen):
+        """Desenha o overlay no canto superior esquerdo."""
+        self._frames_since_refresh += 1
+        if self._overlay is None or self._frames_since_refresh >= self.refresh_frames:
+            self._overlay = self.render_overlay()
+            self._frames_since_refresh = 0
+        screen.blit(self._overlay, (8, 8))
+
+    def render_overlay(self):
+        from assets.fonts.title_font import bitmap_font
+
+        report = self.report()
+        p50, p95, p99 = report["frame"]
+        lines = [
+            f"FPS {report['fps']:.0f}",
+            f"FRAME {p50:.1f} {p95:.1f} {p99:.1f} MS",
+        ]
+        for name, phase, sub_p50, sub_p95, sub_p99 in report["subscribers"]:
+            lines.append(f"{name} {phase.upper()} {sub_p50:.2f} {sub_p95:.2f} {sub_p99:.2f}")
+
+        rendered = [bitmap_font.render(line, "white", 12) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 16
+        height = sum(surface.get_height() + 4 for surface in rendered) + 12
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        y = 8
+        for surface in rendered:
+            overlay.blit(surface, (8, y))
+            y += surface.get_height() + 4
+        return overlay
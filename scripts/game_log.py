@@ -0,0 +1,128 @@
+import os
+import sys
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+
+ROOT_LOGGER = "game"
+OFF = logging.CRITICAL + 10  # Nível acima de todos: nada é registrado
+
+LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "off": OFF,
+}
+
+CONSOLE_FORMAT = "%(message)s"
+FILE_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+
+def get_logger(name):
+    """Logger do módulo `name` (use `__name__`), abaixo do logger do jogo."""
+    if name == "__main__":
+        name = "main"
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def parse_levels(spec):
+    """
+    Converte "info,assets.objects=debug,ui=off" em {"": INFO, "assets.objects": DEBUG, "ui": OFF}.
+
+    A chave vazia é o nível do jogo todo; as outras valem para o módulo e seus submódulos.
+    """
+    levels = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        module, _, level = item.rpartition("=")
+        if level.lower() not in LEVELS:
+            raise ValueError(f"Nível de log desconhecido: {level!r} (use {', '.join(LEVELS)})")
+        levels[module.strip()] = LEVELS[level.lower()]
+    return levels
+
+
+class GameLog:
+    def __init__(self):
+        """
+        Log do jogo, com níveis e filtro por módulo, sem escrever no terminal dentro do frame.
+
+        Os módulos registram com `get_logger(__name__)`. Os registros habilitados só vão para uma
+        fila em memória; uma thread (QueueListener) os grava no console ou em arquivo. Um nível
+        desabilitado custa só a checagem de nível do `logging`, e com `off` nenhuma thread nem
+        handler é criado.
+
+        Configurado pelas variáveis de ambiente LOG_LEVEL (ex.: `debug`,
+        `warning,assets.objects=debug` ou `off`; padrão `info`) e LOG_FILE (grava em arquivo em vez
+        do console).
+        """
+        self.logger = logging.getLogger(ROOT_LOGGER)
+        self.logger.propagate = False  # Não passa pelo logger raiz de quem importar o jogo
+        self.levels = {}
+        self.queue = None
+        self.handler = None
+        self.target = None
+        self.listener = None
+
+    def configure(self, spec="info", path=None):
+        """Aplica os níveis de `spec` (veja parse_levels) e grava em `path` ou no console."""
+        levels = parse_levels(spec)
+        for module in self.levels:
+            if module:
+                logging.getLogger(f"{ROOT_LOGGER}.{module}").setLevel(logging.NOTSET)
+        self.levels = levels
+
+        self.logger.setLevel(levels.get("", logging.INFO))
+        for module, level in levels.items():
+            if module:
+                logging.getLogger(f"{ROOT_LOGGER}.{module}").setLevel(level)
+
+        if self.logger.level == OFF and all(level == OFF for level in levels.values()):
+            self.stop()  # Totalmente silencioso: nem fila, nem thread
+            self.remove_target()
+        else:
+            self.start(path)
+
+    def start(self, path=None):
+        """Cria a fila e a thread que escreve os registros."""
+        self.stop()
+        self.remove_target()
+        if path:
+            self.target = logging.FileHandler(path, encoding="utf-8")
+            self.target.setFormatter(logging.Formatter(FILE_FORMAT))
+        else:
+            self.target = logging.StreamHandler(sys.stdout)
+            self.target.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+
+        self.queue = queue.SimpleQueue()
+        self.handler = QueueHandler(self.queue)
+        self.logger.addHandler(self.handler)
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+
+    def stop(self):
+        """
+        Esvazia a fila (grava o que falta) e encerra a thread. Registros feitos depois disso
+        (ex.: em outros handlers de atexit) são escritos direto no destino.
+        """
+        if self.listener is None:
+            return
+        self.listener.stop()
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(self.target)
+        self.queue = self.handler = self.listener = None
+
+    def remove_target(self):
+        if self.target is not None:
+            self.logger.removeHandler(self.target)
+            self.target.close()
+            self.target = None
+
+
+game_log = GameLog()  # Instância global
+game_log.configure(os.getenv("LOG_LEVEL", "info"), os.getenv("LOG_FILE"))
+atexit.register(game_log.stop)
@@ -1,3 +1,7 @@
+import numpy as np
+from scripts.tracing import traced
+from scripts.render_queue import RenderQueue, insertion_sort
+from scripts.component_store import COMPONENT_STORE
 
 class GameScene:
     def __init__(self, screen):
@@ -8,17 +12,117 @@ class GameScene:
         """
         self.screen = screen
         self.objects = []
+        self.removed = {}  # Objetos removidos que ainda saem de self.objects na próxima compactação
+        self.removed_rects = []  # Áreas da tela que os objetos removidos ocupavam
+        self.render_queue = RenderQueue()  # Desenhos da cena, ordenados por profundidade a cada frame
+        self.collision_world = None  # CollisionWorld recebido em update (params["collision_world"])
+        self.store = COMPONENT_STORE
+        self.rows = None  # Linhas no store dos objetos da cena (refeito quando a cena muda)
+        self.vectorized_rows = None  # Só as dos objetos VECTORIZED
 
     def add_object(self, obj):
         """Adiciona um objeto à cena."""
-        self.objects.append(obj)
+        if obj in self.removed:
+            del self.removed[obj]  # Removido e readicionado antes da compactação: continua na lista
+        else:
+            self.objects.append(obj)
+            self.rows = self.vectorized_rows = None
+        if self.collision_world is not None and obj.collision_component:
+            self.collision_world.register(obj.collision_component)
 
+    def remove_object(self, obj):
+        """
+        Remove um objeto da cena e do mundo de colisão.
+
+        O(1): o objeto é só marcado; `compact_objects` tira todos os marcados da lista de uma vez,
+        no início do próximo update/late_update.
+        """
+        if obj in self.removed:
+            return
+        self.removed[obj] = None
+        if self.collision_world is not None and obj.collision_component:
+            self.collision_world.unregister(obj.collision_component)
+
+    def compact_objects(self):
+        """Tira da lista os objetos removidos, em uma única passada."""
+        if not self.removed:
+            return
+        removed = self.removed
+        self.removed_rects.extend(obj.drawn_rect for obj in removed)
+        self.objects = [obj for obj in self.objects if obj not in removed]
+        self.removed = {}
+        self.rows = self.vectorized_rows = None
+
+    def sync_collision_world(self, world):
+        """Passa a usar `world` e registra nele os objetos com colisão que ainda não estão lá."""
+        if world is self.collision_world:
+            return
+        self.collision_world = world
+        for obj in self.objects:
+            if obj.collision_component:
+                world.register(obj.collision_component)
+
+    def save_previous_positions(self):
+        """Guarda a posição de cada objeto antes do passo de simulação (para interpolar o desenho)."""
+        self.store.save_previous_positions(self.get_rows()[0])
+        for obj in self.objects:
+            if obj.store is not self.store:
+                obj.save_previous_position()
+
+    def is_vectorized(self, obj):
+        return obj.VECTORIZED and obj.store is self.store
+
+    def get_rows(self):
+        """(linhas de todos os objetos da cena no store, linhas dos simulados em lote), na ordem da cena."""
+        if self.rows is None:
+            self.rows = np.array([obj.row for obj in self.objects if obj.store is self.store], dtype=np.intp)
+            self.vectorized_rows = np.array([obj.row for obj in self.objects if self.is_vectorized(obj)], dtype=np.intp)
+        return self.rows, self.vectorized_rows
+
+    @traced()
     def update(self, params):
         """Atualiza todos os objetos na cena."""
+        world = params["collision_world"]
+        self.compact_objects()
+        self.sync_collision_world(world)
+        self.save_previous_positions()
+
+        # Gravidade, movimento, parallax e tempo de vida de todos os carros em uma passada vetorizada
+        expired = self.store.step(self.get_rows()[1], params.get("dt", 0), params.get("delta_x", 0))
+
         for obj in self.objects:
-            obj.update(params)
+            if self.is_vectorized(obj):
+                obj.animate(params)
+            else:
+                obj.update(params)
+            if obj.collision_component:
+                world.update(obj.collision_component)  # Só troca de célula quando sai da faixa ocupada
 
+        for row in expired:
+            owner = self.store.owner(row)
+            if owner is not None:
+                owner.destroy()
+
+    @traced()
     def late_update(self, params):
-        """Atualiza todos os objetos na cena após o update."""
+        """Atualiza todos os objetos na cena após o update e desenha a fila ordenada por profundidade."""
+        self.compact_objects()
+
+        # Mantida ordenada entre frames, a lista chega à fila quase na ordem final
+        insertion_sort(self.objects, key=lambda obj: obj.depth())
+
+        params = {**params, "render_queue": self.render_queue}
+        previous_rects = [obj.drawn_rect for obj in self.objects]
         for obj in self.objects:
-            obj.late_update(params)
\ No newline at end of file
+            obj.late_update(params)
+        self.render_queue.flush(self.screen)
+
+        damage = params.get("damage")
+        if damage is not None:
+            # A área antiga e a nova de cada objeto mudam na tela, e some o que foi removido
+            for obj, previous_rect in zip(self.objects, previous_rects):
+                damage.add(previous_rect)
+                damage.add(obj.drawn_rect)
+            for rect in self.removed_rects:
+                damage.add(rect)
+        self.removed_rects.clear()
\ No newline at end of file
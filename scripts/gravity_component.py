@@ -1,11 +1,28 @@
+from scripts.component_store import Column, ComponentStore
+
+
 class GravityComponent:
-    def __init__(self, gravity=9.8, terminal_velocity=50):
+    gravity = Column("gravity")
+    terminal_velocity = Column("terminal_velocity")
+    velocity_y = Column("vy")
+
+    def __init__(self, gravity=9.8, terminal_velocity=50, store=None, row=None):
         """
         Componente de gravidade para ser adicionado a objetos.
 
+        Os valores ficam na linha do dono no `ComponentStore`, para que a gravidade de muitos
+        objetos seja aplicada de uma vez em `ComponentStore.step`.
+
         :param gravity: Intensidade da gravidade (padrão: 9.8).
         :param terminal_velocity: Velocidade máxima de queda.
+        :param store: ComponentStore do dono. Sem ele, o componente guarda o estado em um store próprio.
+        :param row: Linha do dono em `store`.
         """
+        if store is None:
+            store = ComponentStore(capacity=1)
+            row = store.allocate(self)
+        self.store = store
+        self.row = row
         self.gravity = gravity
         self.terminal_velocity = terminal_velocity
         self.velocity_y = 0  # Velocidade inicial de queda
@@ -16,4 +33,4 @@ class GravityComponent:
 
     def reset_velocity(self):
         """Reseta a velocidade de queda (usado ao tocar o chão)."""
-        self.velocity_y = 0
\ No newline at end of file
+        self.velocity_y = 0
@@ -0,0 +1,214 @@
+import os
+import json
+import random
+import struct
+from time import perf_counter_ns
+import pygame
+
+from scripts.game_log import get_logger
+
+log = get_logger(__name__)
+
+MAGIC = b"PFIR"
+VERSION = 1
+HEADER = struct.Struct("<4sHQI")  # magic, versão, semente do RNG, tamanho das configurações (JSON)
+FRAME = struct.Struct("<fhhBBBB")  # dt, mouse x, mouse y, botões, flags, qtd. de eventos, qtd. de teclas pressionadas
+KEY_EVENT = struct.Struct("<BI")  # tipo (1 = KEYDOWN, 2 = KEYUP), tecla
+SCANCODE = struct.Struct("<H")
+
+FLAG_QUIT = 1
+FLAG_SCENE_READY = 2  # O SceneLoader terminou neste frame
+FLAG_KEYS_CHANGED = 4  # As teclas pressionadas mudaram; senão valem as do frame anterior
+
+EVENT_TYPES = {pygame.KEYDOWN: 1, pygame.KEYUP: 2}
+EVENT_CODES = {code: event_type for event_type, code in EVENT_TYPES.items()}
+
+
+class InputFrame:
+    """Entrada de um frame: eventos de teclado, mouse, teclas pressionadas e o dt usado na simulação."""
+    __slots__ = ("dt", "quit", "key_events", "mouse_pos", "mouse_buttons", "pressed_keys", "scene_ready")
+
+    def __init__(self, dt, quit, key_events, mouse_pos, mouse_buttons, pressed_keys, scene_ready=False):
+        self.dt = dt
+        self.quit = quit
+        self.key_events = key_events  # Lista de (pygame.KEYDOWN/KEYUP, tecla)
+        self.mouse_pos = mouse_pos
+        self.mouse_buttons = mouse_buttons
+        self.pressed_keys = pressed_keys  # pygame.key.ScancodeWrapper, indexado por tecla como get_pressed()
+        self.scene_ready = scene_ready
+
+
+class LiveInput:
+    def __init__(self, seed=None):
+        """
+        Lê a entrada do pygame a cada frame.
+
+        O RNG global é semeado aqui para que uma gravação da sessão possa reproduzi-la.
+
+        :param seed: Semente do módulo `random`; por padrão uma semente aleatória.
+        """
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(8), "little")
+        self.realtime = True
+        self.current = None
+        random.seed(self.seed)
+
+    def poll(self, dt):
+        """Lê os eventos pendentes e o estado do mouse/teclado. `dt` é o tempo do frame anterior."""
+        quit_requested = False
+        key_events = []
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                quit_requested = True
+                break
+            if event.type in EVENT_TYPES:
+                key_events.append((event.type, event.key))
+
+        self.current = InputFrame(dt, quit_requested, key_events, pygame.mouse.get_pos(),
+                                  pygame.mouse.get_pressed(), pygame.key.get_pressed())
+        return self.current
+
+    def scene_ready(self, loader):
+        """Indica se a cena em carregamento pode ser criada neste frame."""
+        self.current.scene_ready = loader.done()
+        return self.current.scene_ready
+
+    def end_frame(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class InputRecorder(LiveInput):
+    def __init__(self, path, settings, seed=None):
+        """
+        Grava a entrada de cada frame em um log binário compacto (veja `InputReplay`).
+
+        O cabeçalho guarda a semente do RNG e as configurações usadas, pois ambas mudam a simulação.
+        As teclas pressionadas só são gravadas nos frames em que mudam.
+
+        :param path: Arquivo de saída.
+        :param settings: Configurações carregadas no início da sessão.
+        :param seed: Semente do módulo `random`; por padrão uma semente aleatória.
+        """
+        super().__init__(seed)
+        self.path = path
+        self.frames = 0
+        self._last_pressed = None
+        settings_data = json.dumps(settings).encode("utf-8")
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.seed, len(settings_data)))
+        self._file.write(settings_data)
+
+    def end_frame(self):
+        """Grava o frame atual; chamado no fim de cada iteração do loop principal."""
+        frame = self.current
+        pressed = tuple(index for index, state in enumerate(frame.pressed_keys) if state)
+        flags = (FLAG_QUIT if frame.quit else 0) | (FLAG_SCENE_READY if frame.scene_ready else 0)
+        if pressed != self._last_pressed:
+            flags |= FLAG_KEYS_CHANGED
+        buttons = sum(1 << i for i, state in enumerate(frame.mouse_buttons[:3]) if state)
+
+        chunks = [FRAME.pack(frame.dt, frame.mouse_pos[0], frame.mouse_pos[1], buttons, flags,
+                             len(frame.key_events), len(pressed) if flags & FLAG_KEYS_CHANGED else 0)]
+        chunks.extend(KEY_EVENT.pack(EVENT_TYPES[event_type], key) for event_type, key in frame.key_events)
+        if flags & FLAG_KEYS_CHANGED:
+            chunks.extend(SCANCODE.pack(scancode) for scancode in pressed)
+            self._last_pressed = pressed
+        self._file.write(b"".join(chunks))
+        self.frames += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            log.info("⏺️ Entrada gravada em %s (%d frames, %d bytes)", self.path, self.frames, os.path.getsize(self.path))
+
+
+class InputReplay:
+    def __init__(self, path, report_path=None):
+        """
+        Reproduz uma sessão gravada por `InputRecorder`, sem limite de FPS.
+
+        Cada frame usa o dt gravado, então a simulação é a mesma da sessão original independente
+        da velocidade da máquina. Ao terminar, mostra os percentis do custo de cada frame.
+
+        :param path: Log gravado.
+        :param report_path: Arquivo JSON opcional com o tempo (em ms) de cada frame reproduzido.
+        """
+        with open(path, "rb") as file:
+            self.data = file.read()
+        magic, version, self.seed, settings_size = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} não é um log de entrada compatível")
+
+        offset = HEADER.size
+        self.settings = json.loads(self.data[offset:offset + settings_size].decode("utf-8"))
+        self.offset = offset + settings_size
+        self.path = path
+        self.report_path = report_path
+        self.realtime = False
+        self.current = None
+        self.frame_times = []
+        self._frame_start = None
+        self._pressed = pygame.key.ScancodeWrapper([False] * 512)
+        random.seed(self.seed)
+
+    def poll(self, dt):
+        now = perf_counter_ns()
+        if self._frame_start is not None:
+            self.frame_times.append(now - self._frame_start)
+        self._frame_start = now
+
+        if self.offset >= len(self.data):
+            # Fim do log: encerra o jogo como se a janela tivesse sido fechada
+            self.current = InputFrame(0, True, [], (0, 0), (False, False, False), self._pressed)
+            return self.current
+
+        frame_dt, mouse_x, mouse_y, buttons, flags, event_count, pressed_count = FRAME.unpack_from(self.data, self.offset)
+        self.offset += FRAME.size
+        key_events = []
+        for _ in range(event_count):
+            event_code, key = KEY_EVENT.unpack_from(self.data, self.offset)
+            self.offset += KEY_EVENT.size
+            key_events.append((EVENT_CODES[event_code], key))
+        if flags & FLAG_KEYS_CHANGED:
+            states = [False] * 512
+            for _ in range(pressed_count):
+                states[SCANCODE.unpack_from(self.data, self.offset)[0]] = True
+                self.offset += SCANCODE.size
+            self._pressed = pygame.key.ScancodeWrapper(states)
+
+        self.current = InputFrame(frame_dt, bool(flags & FLAG_QUIT), key_events, (mouse_x, mouse_y),
+                                  tuple(bool(buttons & (1 << i)) for i in range(3)), self._pressed,
+                                  bool(flags & FLAG_SCENE_READY))
+        return self.current
+
+    def scene_ready(self, loader):
+        """Repete o frame em que a cena ficou pronta na gravação, esperando o carregamento se preciso."""
+        if self.current.scene_ready:
+            loader.wait()
+        return self.current.scene_ready
+
+    def end_frame(self):
+        pass
+
+    def report(self):
+        """Quantidade de frames, tempo total e percentis (p50/p95/p99) do custo de cada frame, em ms."""
+        if not self.frame_times:
+            return {"frames": 0, "total": 0.0, "frame": (0.0, 0.0, 0.0)}
+        ordered = sorted(self.frame_times)
+        last = len(ordered) - 1
+        return {
+            "frames": len(ordered),
+            "total": sum(ordered) / 1e9,
+            "frame": tuple(ordered[min(last, int(last * point / 100 + 0.5))] / 1e6 for point in (50, 95, 99)),
+        }
+
+    def close(self):
+        report = self.report()
+        p50, p95, p99 = report["frame"]
+        print(f"⏯️ Replay de {self.path}: {report['frames']} frames em {report['total']:.2f}s "
+              f"(frame p50 {p50:.2f}ms, p95 {p95:.2f}ms, p99 {p99:.2f}ms)")
+        if self.report_path:
+            with open(self.report_path, "w", encoding="utf-8") as file:
+                json.dump({**report, "frame_ms": [elapsed / 1e6 for elapsed in self.frame_times]}, file)
@@ -0,0 +1,149 @@
+import os
+import sys
+import marshal
+import hashlib
+
+from scripts.game_log import get_logger
+
+ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+LOCALES_PATH = os.path.join(ROOT_PATH, "locales")
+CACHE_PATH = os.path.join(ROOT_PATH, "assets", "build", "locales.marshal")
+
+CACHE_VERSION = 1
+
+log = get_logger(__name__)
+
+
+def flatten(tree, prefix=""):
+    """Transforma o YAML aninhado em {"secao.chave": texto}, com chaves e textos internados."""
+    table = {}
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            table.update(flatten(value, f"{path}."))
+        else:
+            table[sys.intern(path)] = sys.intern(str(value))
+    return table
+
+
+class Texts:
+    __slots__ = ("language", "table")
+
+    def __init__(self, language, table):
+        """
+        Textos de um idioma: tabela plana {"secao.chave": texto}.
+
+        :param language: Código do idioma (nome do arquivo em locales/).
+        :param table: Tabela compilada por `LocaleCatalog`.
+        """
+        self.language = language
+        self.table = table
+
+    def __getitem__(self, key):
+        return self.table[key]
+
+    def get(self, key, default=None):
+        return self.table.get(key, default)
+
+    def keys(self, section):
+        """Chaves de uma seção, na ordem do arquivo (ex.: keys("languages") -> ["en", "es", "pt"])."""
+        prefix = f"{section}."
+        return [key[len(prefix):] for key in self.table if key.startswith(prefix)]
+
+
+class LocaleCatalog:
+    def __init__(self, locales_path=LOCALES_PATH, cache_path=CACHE_PATH):
+        """
+        Textos de todos os idiomas, compilados uma vez e compartilhados pelos menus.
+
+        Cada `locales/<idioma>.yml` vira uma tabela plana guardada em um cache `marshal`, junto
+        com o mtime e o hash SHA-1 do arquivo. Nas próximas execuções o cache é lido inteiro
+        sem YAML; um arquivo só é recompilado se o mtime mudou e o hash também. Trocar de idioma é
+        só uma consulta em dicionário.
+
+        :param locales_path: Pasta dos arquivos .yml.
+        :param cache_path: Arquivo do cache compilado.
+        """
+        self.locales_path = locales_path
+        self.cache_path = cache_path
+        self.entries = None  # idioma -> {"mtime", "hash", "table"}
+        self.texts = {}  # idioma -> Texts
+
+    def get(self, language):
+        """Textos do idioma (vazio se não houver arquivo para ele)."""
+        texts = self.texts.get(language)
+        if texts is None:
+            self.load()
+            entry = self.entries.get(language)
+            texts = self.texts[language] = Texts(language, entry["table"] if entry else {})
+        return texts
+
+    def languages(self):
+        self.load()
+        return list(self.entries)
+
+    def load(self):
+        """Lê o cache e recompila só os arquivos que mudaram (uma vez por execução)."""
+        if self.entries is not None:
+            return
+
+        cached = {}
+        try:
+            with open(self.cache_path, "rb") as file:
+                data = marshal.load(file)
+            if data.get("version") == CACHE_VERSION:
+                cached = data["locales"]
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        entries = {}
+        dirty = False
+        for file_name in sorted(os.listdir(self.locales_path)):
+            if not file_name.endswith(".yml"):
+                continue
+            language = file_name[:-4]
+            path = os.path.join(self.locales_path, file_name)
+            mtime = os.stat(path).st_mtime_ns
+            entry = cached.get(language)
+
+            if entry is None or entry["mtime"] != mtime:
+                with open(path, "rb") as file:
+                    source = file.read()
+                digest = hashlib.sha1(source).hexdigest()
+                if entry is None or entry["hash"] != digest:
+                    entry = {"hash": digest, "table": self.compile(source)}
+                entry["mtime"] = mtime
+                dirty = True
+            else:
+                entry["table"] = {sys.intern(key): sys.intern(value) for key, value in entry["table"].items()}
+            entries[language] = entry
+
+        self.entries = entries
+        if dirty or set(cached) != set(entries):
+            self.save()
+
+    @staticmethod
+    def compile(source):
+        """Converte o YAML em tabela plana. Só roda quando um arquivo de idioma muda."""
+        import yaml
+
+        return flatten(yaml.safe_load(source) or {})
+
+    def save(self):
+        """Grava o cache (arquivo temporário + os.replace)."""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = f"{self.cache_path}.tmp"
+            with open(temp_path, "wb") as file:
+                marshal.dump({"version": CACHE_VERSION, "locales": self.entries}, file)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            log.warning("⚠️ Não foi possível gravar o cache de idiomas: %s", e)
+
+    def invalidate(self):
+        """Esquece as tabelas carregadas; a próxima consulta revalida os arquivos."""
+        self.entries = None
+        self.texts.clear()
+
+
+locales = LocaleCatalog()
@@ -0,0 +1,35 @@
+class ObjectPool:
+    def __init__(self, factory, max_size, prefill=0):
+        """
+        Reserva de objetos reaproveitáveis, para não criar (e carregar animações) a cada spawn.
+
+        :param factory: Função sem argumentos que cria um objeto novo.
+        :param max_size: Teto de objetos existentes (livres + em uso). `acquire` retorna None ao atingi-lo.
+        :param prefill: Quantos objetos criar já no início.
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.free = []
+        self.in_use = {}  # objeto -> None (dicionário para remoção O(1) e ordem determinística)
+        for _ in range(min(prefill, max_size)):
+            self.free.append(factory())
+
+    def acquire(self):
+        """Retorna um objeto livre (criando um se ainda houver espaço), ou None se o teto foi atingido."""
+        if self.free:
+            obj = self.free.pop()
+        elif len(self.in_use) < self.max_size:
+            obj = self.factory()
+        else:
+            return None
+        self.in_use[obj] = None
+        return obj
+
+    def release(self, obj):
+        """Devolve um objeto ao pool (ignorado se ele não estiver em uso)."""
+        if self.in_use.pop(obj, 0) is None:
+            self.free.append(obj)
+
+    def __len__(self):
+        """Quantidade de objetos existentes (livres + em uso)."""
+        return len(self.free) + len(self.in_use)
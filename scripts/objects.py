@@ -2,32 +2,87 @@ import pygame
 from scripts.animation_handler import AnimationHandler
 from scripts.gravity_component import GravityComponent
 from scripts.collision_component import CollisionComponent
+from scripts.component_store import COMPONENT_STORE, Column
 
 class Object:
-    def __init__(self, x, y, animations, width=0, height=0, use_gravity=False, use_collision=False):
+    # Simulado em lote por ComponentStore.step (veja GameScene.update); o próprio objeto só anima
+    VECTORIZED = False
+
+    x = Column("x")
+    y = Column("y")
+    previous_x = Column("previous_x")  # Posição no passo de simulação anterior, usada para interpolar o desenho
+    previous_y = Column("previous_y")
+
+    def __init__(self, x, y, animations, width=0, height=0, use_gravity=False, use_collision=False, animation_prefetch=None, pixel_perfect=False, store=None):
         """
         Classe base para objetos interativos do jogo.
 
         :param x: Posição X inicial
         :param y: Posição Y inicial
-        :param animations: Dicionário de animações {nome: Animation}
+        :param animations: Dicionário de animações {nome: Animation ou AnimationDescriptor}
         :param width: Largura do objeto (usado para colisão)
         :param height: Altura do objeto (usado para colisão)
         :param use_gravity: Define se o objeto será afetado pela gravidade
         :param use_collision: Define se o objeto terá colisão ativa
+        :param animation_prefetch: Estados que devem ser pré-carregados após cada estado (veja AnimationHandler)
+        :param pixel_perfect: Colisão confirmada pelos pixels visíveis do sprite (veja CollisionComponent)
+        :param store: ComponentStore onde ficam posição, velocidade e gravidade (padrão: COMPONENT_STORE)
         """
-        self.x = x
-        self.y = y
+        self.store = store if store is not None else COMPONENT_STORE
+        self.row = self.store.allocate(self, x=x, y=y, previous_x=x, previous_y=y)
+        self.drawn_rect = pygame.Rect(0, 0, 0, 0)  # Área ocupada no último desenho
         self.width = width
         self.height = height
-        self.animation_handler = AnimationHandler(animations=animations)
-        self.gravity_component = GravityComponent() if use_gravity else None
-        self.collision_component = CollisionComponent(self, height, width) if use_collision else None
+        self.animation_handler = AnimationHandler(animations=animations, prefetch=animation_prefetch)
+        self.gravity_component = GravityComponent(store=self.store, row=self.row) if use_gravity else None
+        self.collision_component = CollisionComponent(self, width, height, pixel_perfect) if use_collision else None
 
     def set_animation(self, animation_name):
         """Define a animação atual do objeto."""
         self.animation_handler.set_animation(animation_name)
 
+    def save_previous_position(self):
+        """Guarda a posição atual antes de um passo de simulação."""
+        self.previous_x = self.x
+        self.previous_y = self.y
+
+    def render_position(self, alpha=1.0):
+        """Posição interpolada entre o passo anterior e o atual (`alpha` de 0 a 1)."""
+        return (self.previous_x + (self.x - self.previous_x) * alpha,
+                self.previous_y + (self.y - self.previous_y) * alpha)
+
+    def depth(self):
+        """Profundidade na rua pseudo-3D: o Y da base do objeto. Quem está mais abaixo fica na frente."""
+        return self.y + self.height / 2
+
+    def submit_sprite(self, screen, sprite, position, depth, render_queue=None):
+        """Envia o sprite para a fila de desenho da cena, ou desenha direto se não houver fila."""
+        if render_queue is not None:
+            render_queue.submit(sprite, position, depth, owner=self)
+        else:
+            self.drawn_rect = screen.blit(sprite, position)
+
+    def sprite_size(self):
+        """Tamanho em que o quadro da animação é desenhado."""
+        return self.width, self.height
+
+    def collision_mask(self):
+        """
+        (máscara, canto na tela) do frame atual, na posição da simulação (sem interpolação).
+
+        A máscara vem do cache da animação, então só é calculada na primeira vez que o frame
+        aparece com esse tamanho e espelhamento.
+        """
+        if not self.animation_handler.current_animation:
+            return None
+        width, height = self.sprite_size()
+        mask, (offset_x, offset_y) = self.animation_handler.get_mask((width, height))
+        return mask, (self.x - width // 2 + offset_x, self.y - height // 2 + offset_y)
+
+    def animate(self, params):
+        """Parte do update que não é vetorizada: a animação. Usado por GameScene para objetos VECTORIZED."""
+        self.animation_handler.updateState()
+
     def update(self, dt):
         """Atualiza a animação do objeto."""
         self.animation_handler.updateState()
@@ -38,11 +93,13 @@ class Object:
 
     def late_update(self, params):
         """Verifica colisão com outros objetos."""
-        self.draw(params["screen"])
+        self.draw(params["screen"], params.get("alpha", 1.0), params.get("render_queue"))
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0, render_queue=None):
         """Desenha o objeto na tela com a escala definida por width e height."""
-        sprite = self.animation_handler.get_sprite()
-        if sprite:
-            scaled_sprite = pygame.transform.scale(sprite, (self.width, self.height))
-            screen.blit(scaled_sprite, (self.x - self.width // 2, self.y - self.height // 2))
\ No newline at end of file
+        if self.animation_handler.current_animation:
+            x, y = self.render_position(alpha)
+            width, height = self.sprite_size()
+            scaled_sprite, (offset_x, offset_y) = self.animation_handler.get_sprite((width, height))
+            position = (x - width // 2 + offset_x, y - height // 2 + offset_y)
+            self.submit_sprite(screen, scaled_sprite, position, y + self.height / 2, render_queue)
\ No newline at end of file
@@ -0,0 +1,53 @@
+def insertion_sort(items, key):
+    """
+    Ordena `items` no lugar, de forma estável.
+
+    Ordenação por inserção: O(n) quando a lista já está quase ordenada, o caso comum de objetos
+    que mudam pouco de profundidade de um frame para o outro.
+    """
+    for i in range(1, len(items)):
+        item = items[i]
+        item_key = key(item)
+        j = i - 1
+        while j >= 0 and key(items[j]) > item_key:
+            items[j + 1] = items[j]
+            j -= 1
+        items[j + 1] = item
+    return items
+
+
+class RenderQueue:
+    BACKGROUND = 0
+    OBJECTS = 1
+
+    def __init__(self):
+        """
+        Fila de desenho de uma cena.
+
+        Durante o `late_update` os objetos enviam (superfície, posição, profundidade) em vez de
+        desenhar direto na tela. `flush` ordena cada camada pela profundidade (o Y da base, no
+        pseudo-3D da rua) e desenha cada camada com uma única chamada a `screen.blits`.
+        """
+        self.layers = {}
+
+    def submit(self, surface, position, depth=0, layer=OBJECTS, owner=None):
+        """
+        Agenda um desenho.
+
+        :param surface: Superfície a desenhar.
+        :param position: Canto superior esquerdo na tela.
+        :param depth: Profundidade; valores maiores ficam na frente.
+        :param layer: Camada; camadas menores são desenhadas primeiro.
+        :param owner: Objeto que recebe em `drawn_rect` a área ocupada na tela.
+        """
+        self.layers.setdefault(layer, []).append((depth, surface, position, owner))
+
+    def flush(self, screen):
+        """Desenha e esvazia a fila."""
+        for layer in sorted(self.layers):
+            items = insertion_sort(self.layers[layer], key=lambda item: item[0])
+            rects = screen.blits([(surface, position) for _, surface, position, _ in items])
+            for (_, _, _, owner), rect in zip(items, rects):
+                if owner is not None:
+                    owner.drawn_rect = rect
+        self.layers.clear()
@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from scripts.asset_cache import asset_cache
+from scripts.asset_pack import asset_pack
+from scripts.texture_atlas import texture_atlas
+from scripts.game_log import get_logger
+
+log = get_logger(__name__)
+
+
+class SceneLoader:
+    def __init__(self, scene_class, screen, max_workers=4):
+        """
+        Carrega os assets de uma cena em segundo plano enquanto o jogo continua desenhando.
+
+        A classe da cena informa seus assets em `preload_assets(screen_size)`, um dicionário
+        {nome: função sem argumentos}. Cada função roda em uma thread do pool; quando todas
+        terminam, `build()` cria a cena com os resultados já em memória.
+
+        :param scene_class: Classe da cena (ex.: MainScene).
+        :param screen: Superfície onde a cena será desenhada.
+        :param max_workers: Quantidade de threads usadas para decodificar os assets.
+        """
+        self.scene_class = scene_class
+        self.screen = screen
+        self.completed = 0
+        self._lock = threading.Lock()
+
+        # Relê o mtime dos arquivos: o que mudou em disco desde a última cena é recarregado
+        asset_cache.refresh()
+
+        # Índices abertos aqui, na thread principal, antes de qualquer thread do pool precisar deles
+        asset_pack.open()
+        texture_atlas.load()
+
+        jobs = scene_class.preload_assets(screen.get_size())
+        self.total = len(jobs)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scene-loader")
+        self._futures = {name: self._executor.submit(job) for name, job in jobs.items()}
+        for future in self._futures.values():
+            future.add_done_callback(self._on_job_done)
+
+    def _on_job_done(self, future):
+        with self._lock:
+            self.completed += 1
+
+    def progress(self):
+        """Fração dos assets já carregados (0.0 a 1.0)."""
+        return self.completed / self.total if self.total else 1.0
+
+    def done(self):
+        """Indica se todos os assets terminaram de carregar."""
+        return self.completed >= self.total
+
+    def wait(self):
+        """Bloqueia até todos os assets terminarem de carregar (atendendo as conversões que eles pedirem)."""
+        asset_cache.wait_for(lambda timeout: not wait(self._futures.values(), timeout).not_done)
+        with self._lock:
+            self.completed = self.total
+
+    def build(self):
+        """Cria a cena com os assets carregados. Assets que falharam são carregados pela própria cena."""
+        self.wait()
+        assets = {}
+        for name, future in self._futures.items():
+            try:
+                assets[name] = future.result()
+            except Exception as e:
+                log.warning("⚠️ Erro ao pré-carregar '%s': %s", name, e, exc_info=True)
+        self._executor.shutdown(wait=False)
+        return self.scene_class(self.screen, assets=assets)
@@ -0,0 +1,154 @@
+import os
+import json
+import threading
+
+from scripts.game_log import get_logger
+
+CONFIG_PATH = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")), "config", "settings.json")
+
+log = get_logger(__name__)
+
+
+class SettingsStore:
+    DEFAULTS = {"sound": 100, "language": "en", "difficulty": "medium", "selected_character": None}
+    # Tipos aceitos para cada chave conhecida; chaves novas aceitam qualquer valor serializável em JSON
+    TYPES = {
+        "sound": (str, int),
+        "language": str,
+        "difficulty": str,
+        "selected_character": (str, type(None)),
+    }
+    # Valores aceitos para as chaves que são uma escolha entre opções fixas
+    CHOICES = {
+        "difficulty": ("easy", "medium", "hard"),
+    }
+
+    def __init__(self, path=CONFIG_PATH, save_delay=0.5):
+        """
+        Configurações do jogo em memória, com avisos de mudança e gravação em segundo plano.
+
+        Os menus leem as chaves direto daqui (sem JSON no loop de frames) e usam `subscribe` para
+        reagir só quando uma chave muda. Alterações seguidas são juntadas: o arquivo é gravado
+        uma vez, `save_delay` segundos depois da última, numa thread própria, escrevendo um arquivo
+        temporário e trocando-o com `os.replace` (o settings.json nunca fica pela metade).
+
+        :param path: Arquivo JSON das configurações.
+        :param save_delay: Espera, em segundos, antes de gravar as alterações acumuladas.
+        """
+        self.path = path
+        self.save_delay = save_delay
+        self.persistent = True  # Desligado no replay: as configurações da gravação não vão para o disco
+        self.values = dict(self.DEFAULTS)
+        self.subscribers = {}  # chave -> [callback(chave, valor)]
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def load(self):
+        """Lê o arquivo de configurações; sem ele, grava os valores padrão."""
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as file:
+                self.replace(json.load(file))
+            log.info("🔄 Configurações carregadas com sucesso!")
+        else:
+            self.replace(self.DEFAULTS)
+            self.schedule_save()
+            log.warning("⚠️ Nenhuma configuração encontrada. Criando padrão.")
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def snapshot(self):
+        """Cópia das configurações atuais."""
+        return dict(self.values)
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def update(self, new_settings):
+        """Atualiza ou adiciona configurações sem remover as existentes, avisa os inscritos e agenda a gravação."""
+        if self._apply(new_settings):
+            self.schedule_save()
+
+    def replace(self, new_settings):
+        """
+        Troca as configurações em memória (ex.: as do arquivo ou de uma sessão gravada), sem agendar
+        gravação. Valores inválidos vindos de fora voltam ao padrão, com um aviso.
+        """
+        values = {**self.DEFAULTS, **new_settings}
+        for key, value in values.items():
+            try:
+                self._validate(key, value)
+            except (TypeError, ValueError) as e:
+                log.warning("⚠️ %s; usando o padrão %r", e, self.DEFAULTS.get(key))
+                values[key] = self.DEFAULTS.get(key)
+        self._apply(values)
+
+    def subscribe(self, key, callback):
+        """Chama `callback(chave, valor)` sempre que `key` mudar de valor."""
+        self.subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, key, callback):
+        callbacks = self.subscribers.get(key)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def schedule_save(self):
+        """Agenda a gravação; chamadas dentro do intervalo `save_delay` são juntadas numa só."""
+        if not self.persistent:
+            return
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.save_delay, self._save, args=(self.snapshot(),))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Grava agora uma alteração pendente (chamado ao sair do jogo)."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+            timer.join()
+            self._save(timer.args[0])
+
+    def _apply(self, new_settings):
+        """Aplica os valores e avisa os inscritos das chaves que mudaram. Retorna se algo mudou."""
+        changed = []
+        for key, value in new_settings.items():
+            self._validate(key, value)
+            if key not in self.values or self.values[key] != value:
+                self.values[key] = value
+                changed.append(key)
+
+        for key in changed:
+            for callback in list(self.subscribers.get(key, ())):
+                callback(key, self.values[key])
+        return bool(changed)
+
+    def _validate(self, key, value):
+        """Levanta TypeError/ValueError se `value` não for aceito pela chave `key`."""
+        expected = self.TYPES.get(key)
+        if expected is not None and not isinstance(value, expected):
+            raise TypeError(f"Configuração '{key}' não aceita {type(value).__name__}: {value!r}")
+        choices = self.CHOICES.get(key)
+        if choices is not None and value not in choices:
+            raise ValueError(f"Configuração '{key}' não aceita {value!r} (use {', '.join(choices)})")
+
+    def _save(self, values):
+        """Grava `values` em um arquivo temporário e o troca pelo definitivo."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(values, file, indent=4)
+        os.replace(temp_path, self.path)
+        log.debug("💾 Configurações salvas com sucesso!")
+
+
+settings = SettingsStore()
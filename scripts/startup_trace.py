@@ -0,0 +1,149 @@
+import os
+import sys
+import json
+from time import perf_counter
+from importlib.abc import MetaPathFinder
+
+PROCESS_START = perf_counter()  # main.py importa este módulo antes de qualquer outro do jogo
+
+from scripts.game_log import get_logger  # Depois de PROCESS_START, para que o import do logging também conte
+
+log = get_logger(__name__)
+
+
+class _TimedLoader:
+    """Envolve o loader de um módulo para medir quanto tempo sua execução (exec_module) leva."""
+
+    def __init__(self, loader, trace, name):
+        self._loader = loader
+        self._trace = trace
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self._trace.measure(self._name, "import"):
+            self._loader.exec_module(module)
+
+
+class _ImportTimer(MetaPathFinder):
+    def __init__(self, trace):
+        self.trace = trace
+
+    def find_spec(self, fullname, path, target=None):
+        # Pergunta aos outros finders e só troca o loader do spec encontrado
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self.trace, fullname)
+                return spec
+        return None
+
+
+class StartupTrace:
+    def __init__(self):
+        """
+        Mede a inicialização do jogo: cada import, cada construtor marcado com `measure` e o
+        tempo até o primeiro frame desenhado (time-to-first-frame).
+
+        Ligado pela variável de ambiente STARTUP_TRACE: com `1` o relatório é impresso ao aparecer
+        o primeiro frame; com um caminho de arquivo ele também é gravado em JSON. O tempo até o
+        primeiro frame é sempre medido e fica em `first_frame_ms`.
+        """
+        self.enabled = False
+        self.output_path = None
+        self.records = []  # (nome, tipo, início em ms, total em ms, próprio em ms, profundidade)
+        self.stack = []  # [tempo gasto nos filhos] de cada medição aberta
+        self.first_frame_ms = None
+        self._finder = None
+
+    def enable(self, output_path=None):
+        """Liga a medição, inclusive dos imports feitos daqui em diante."""
+        self.enabled = True
+        self.output_path = output_path
+        if self._finder is None:
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def disable(self):
+        self.enabled = False
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def measure(self, name, kind="init"):
+        """Context manager que mede um trecho da inicialização (ex.: o construtor de um menu)."""
+        return _Measure(self, name, kind)
+
+    def elapsed_ms(self):
+        """Milissegundos desde o início do processo (import deste módulo)."""
+        return (perf_counter() - PROCESS_START) * 1000
+
+    def mark_first_frame(self):
+        """Registra o primeiro frame com conteúdo enviado ao display e, se ligado, mostra o relatório."""
+        if self.first_frame_ms is not None:
+            return
+        self.first_frame_ms = self.elapsed_ms()
+        log.info("⏱️ Primeiro frame em %.1f ms", self.first_frame_ms)
+        if self.enabled:
+            self.report()
+            self.disable()
+
+    def report(self, limit=20):
+        """Imprime os trechos mais caros (por tempo próprio) e grava o JSON, se pedido."""
+        imports = sum(record[4] for record in self.records if record[1] == "import")
+        inits = sum(record[4] for record in self.records if record[1] == "init")
+        print(f"⏱️ Inicialização: imports {imports:.1f} ms, construtores {inits:.1f} ms, primeiro frame {self.first_frame_ms or 0:.1f} ms")
+        print(f"{'trecho':<48}{'tipo':>8}{'próprio':>10}{'total':>10}")
+        for name, kind, _, total, own, _ in sorted(self.records, key=lambda record: record[4], reverse=True)[:limit]:
+            print(f"{name:<48}{kind:>8}{own:>8.1f}ms{total:>8.1f}ms")
+
+        if self.output_path:
+            with open(self.output_path, "w", encoding="utf-8") as file:
+                json.dump({
+                    "first_frame_ms": self.first_frame_ms,
+                    "records": [
+                        {"name": name, "kind": kind, "start_ms": start, "total_ms": total, "self_ms": own, "depth": depth}
+                        for name, kind, start, total, own, depth in self.records
+                    ],
+                }, file, indent=2)
+            print(f"💾 Trace de inicialização gravado em {self.output_path}")
+
+
+class _Measure:
+    __slots__ = ("trace", "name", "kind", "start")
+
+    def __init__(self, trace, name, kind):
+        self.trace = trace
+        self.name = name
+        self.kind = kind
+
+    def __enter__(self):
+        if self.trace.enabled:
+            self.start = perf_counter()
+            self.trace.stack.append(0.0)
+        return self
+
+    def __exit__(self, *exc):
+        trace = self.trace
+        if trace.enabled and trace.stack:
+            total = (perf_counter() - self.start) * 1000
+            children = trace.stack.pop()
+            if trace.stack:
+                trace.stack[-1] += total
+            trace.records.append((self.name, self.kind, (self.start - PROCESS_START) * 1000, total, total - children, len(trace.stack)))
+        return False
+
+
+startup = StartupTrace()
+
+_startup_trace = os.getenv("STARTUP_TRACE")
+if _startup_trace:
+    startup.enable(None if _startup_trace == "1" else _startup_trace)
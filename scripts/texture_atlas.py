@@ -0,0 +1,191 @@
+import os
+import sys
+import json
+import threading
+import pygame
+
+ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT_PATH)
+
+from scripts.asset_cache import asset_cache
+from scripts.asset_pack import MANIFEST_PATH, relative_path
+
+ATLAS_DIR = os.path.join(ROOT_PATH, "assets", "build")
+ATLAS_INDEX_PATH = os.path.join(ATLAS_DIR, "atlas.json")
+PAGE_SIZE = 2048
+PADDING = 1  # Espaço entre os frames para evitar que pixels vizinhos vazem ao escalar
+
+# Spritesheets que não são animações, mas também entram no atlas
+EXTRA_SOURCES = [
+    {"sheet": "assets/fonts/title-font.png", "frames": "assets/fonts/title-font-positions.json"},
+]
+
+
+def rect_key(x, y, width, height):
+    return f"{x},{y},{width},{height}"
+
+
+class TextureAtlas:
+    def __init__(self, index_path=ATLAS_INDEX_PATH):
+        """
+        Atlas de texturas compartilhado pelas animações e pela fonte bitmap.
+
+        Cada frame das spritesheets originais foi copiado para uma das páginas do atlas; o índice
+        mapeia (spritesheet, retângulo original) para (página, posição no atlas). Os frames são
+        entregues como subsuperfícies das páginas, que ficam carregadas enquanto o atlas existir.
+
+        :param index_path: Caminho do índice gerado por `python -m scripts.texture_atlas`.
+        """
+        self.index_path = index_path
+        self.index = None
+        self.pages = {}
+        self._lock = threading.Lock()  # Threads de carregamento podem ler o índice ao mesmo tempo
+
+    def load(self):
+        """
+        Lê o índice do atlas (uma única vez). Retorna False se ele não existir.
+
+        Como em `AssetPack.open`, o índice só é publicado depois de lido; quem chega durante a
+        leitura espera por ele.
+        """
+        index = self.index
+        if index is not None:
+            return bool(index)
+
+        with self._lock:
+            if self.index is None:
+                index = {}
+                if os.path.exists(self.index_path):
+                    with open(self.index_path, "r", encoding="utf-8") as file:
+                        index = json.load(file)
+                self.index = index
+            return bool(self.index)
+
+    def get_page(self, page):
+        if page not in self.pages:
+            path = os.path.join(os.path.dirname(self.index_path), self.index["pages"][page])
+            self.pages[page] = asset_cache.load_image(path)
+        return self.pages[page]
+
+    def get_frames(self, spritesheet_path, rects):
+        """
+        Resolve os retângulos de uma spritesheet para subsuperfícies do atlas.
+
+        :param spritesheet_path: Spritesheet original.
+        :param rects: Lista de (x, y, largura, altura) na spritesheet original.
+        :return: Lista de superfícies, ou None se a spritesheet não estiver no atlas ou tiver mudado.
+        """
+        if not self.load():
+            return None
+
+        sheet = self.index["sheets"].get(relative_path(spritesheet_path))
+        if sheet is None:
+            return None
+        try:
+            if asset_cache.file_key(spritesheet_path)[1] != sheet["mtime"]:
+                return None
+        except OSError:
+            return None
+
+        frames = []
+        for x, y, width, height in rects:
+            placement = sheet["rects"].get(rect_key(x, y, width, height))
+            if placement is None:
+                return None
+            page, atlas_x, atlas_y = placement
+            frames.append(self.get_page(page).subsurface(pygame.Rect(atlas_x, atlas_y, width, height)))
+        return frames
+
+
+def pack_rects(sizes, page_size=PAGE_SIZE, padding=PADDING):
+    """
+    Empacota retângulos em páginas usando prateleiras (shelf packing).
+
+    Os retângulos são ordenados do mais alto para o mais baixo e colocados lado a lado em
+    prateleiras; uma nova prateleira (ou página) é aberta quando não há mais espaço.
+
+    :param sizes: Dicionário {chave: (largura, altura)}.
+    :return: ({chave: (página, x, y)}, [(largura, altura) de cada página])
+    """
+    order = sorted(sizes, key=lambda key: (sizes[key][1], sizes[key][0]), reverse=True)
+    placements = {}
+    pages = []  # Cada página: {"width", "shelves": [[y, altura, x_livre]], "height"}
+
+    for key in order:
+        width, height = sizes[key]
+        page_width = max(page_size, width)
+        placed = False
+        for page_index, page in enumerate(pages):
+            for shelf in page["shelves"]:
+                if height <= shelf[1] and shelf[2] + width <= page["width"]:
+                    placements[key] = (page_index, shelf[2], shelf[0])
+                    shelf[2] += width + padding
+                    placed = True
+                    break
+            if placed:
+                break
+            if page["height"] + height <= page_size and width <= page["width"]:
+                page["shelves"].append([page["height"], height, width + padding])
+                placements[key] = (page_index, 0, page["height"])
+                page["height"] += height + padding
+                placed = True
+                break
+        if not placed:
+            pages.append({"width": page_width, "shelves": [[0, height, width + padding]], "height": height + padding})
+            placements[key] = (len(pages) - 1, 0, 0)
+
+    used_widths = [0] * len(pages)
+    for key, (page_index, x, _) in placements.items():
+        used_widths[page_index] = max(used_widths[page_index], x + sizes[key][0])
+    return placements, [(used_widths[i], page["height"]) for i, page in enumerate(pages)]
+
+
+def build_atlas(output_dir=ATLAS_DIR):
+    """Gera as páginas do atlas e o índice a partir do manifesto de animações e das fontes."""
+    with open(MANIFEST_PATH, "r", encoding="utf-8") as file:
+        sources = json.load(file) + EXTRA_SOURCES
+
+    # Agrupa os retângulos por spritesheet, eliminando repetições (ex.: walk e run da Blaze)
+    sheets = {}
+    for item in sources:
+        with open(os.path.join(ROOT_PATH, item["frames"]), "r", encoding="utf-8") as file:
+            data = json.load(file)
+        rects = sheets.setdefault(item["sheet"], set())
+        rects.update((frame["x"], frame["y"], frame["width"], frame["height"]) for frame in data)
+
+    sizes = {(sheet, rect): rect[2:] for sheet, rects in sheets.items() for rect in rects}
+    placements, page_sizes = pack_rects(sizes)
+
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    for page in pages:
+        page.fill((0, 0, 0, 0))
+
+    index = {"pages": [f"atlas-{i}.png" for i in range(len(pages))], "sheets": {}}
+    for sheet_path in sheets:
+        absolute_path = os.path.join(ROOT_PATH, sheet_path)
+        image = pygame.image.load(absolute_path).convert_alpha()
+        index["sheets"][sheet_path] = {"mtime": os.stat(absolute_path).st_mtime_ns, "rects": {}}
+        for rect in sheets[sheet_path]:
+            page, x, y = placements[(sheet_path, rect)]
+            # BLEND_RGBA_MAX sobre a página vazia copia os pixels exatamente, sem misturar o alpha
+            pages[page].blit(image, (x, y), pygame.Rect(rect), special_flags=pygame.BLEND_RGBA_MAX)
+            index["sheets"][sheet_path]["rects"][rect_key(*rect)] = [page, x, y]
+
+    os.makedirs(output_dir, exist_ok=True)
+    for name, page in zip(index["pages"], pages):
+        pygame.image.save(page, os.path.join(output_dir, name))
+    with open(os.path.join(output_dir, "atlas.json"), "w", encoding="utf-8") as file:
+        json.dump(index, file)
+
+    print(f"✅ Atlas gerado: {len(sizes)} frames de {len(sheets)} spritesheets em {len(pages)} página(s) {page_sizes}")
+
+
+texture_atlas = TextureAtlas()  # Instância global usada por Animation e BitmapFont
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    build_atlas()
+    pygame.quit()
@@ -0,0 +1,122 @@
+import os
+import json
+import atexit
+import functools
+import threading
+from collections import deque
+from time import perf_counter_ns
+
+from scripts.game_log import get_logger
+
+log = get_logger(__name__)
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "category", "start")
+
+    def __init__(self, tracer, name, category):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        # deque.append é atômico no CPython, então o buffer dispensa locks
+        self.tracer.events.append((self.name, self.category, self.start, perf_counter_ns(), threading.get_ident()))
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    def __init__(self, capacity=200_000):
+        """
+        Registra intervalos de tempo (spans) em um buffer circular e os exporta no formato de
+        trace events do Chrome/Perfetto (abra o arquivo em chrome://tracing ou ui.perfetto.dev).
+
+        O tracer fica desligado até `enable()`; a variável de ambiente TRACE_FILE o liga na inicialização.
+        Quando o buffer enche, os spans mais antigos são descartados.
+
+        :param capacity: Quantidade máxima de spans guardados.
+        """
+        self.enabled = False
+        self.output_path = None
+        self.events = deque(maxlen=capacity)
+        self._exit_hook = False
+
+    def enable(self, output_path):
+        """Liga o tracer; o trace é gravado em `output_path` por `flush()` e ao sair do jogo."""
+        self.enabled = True
+        self.output_path = output_path
+        if not self._exit_hook:
+            atexit.register(self.flush)
+            self._exit_hook = True
+
+    def span(self, name, category="frame"):
+        """Context manager que mede o bloco: `with tracer.span("update"): ...`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category)
+
+    def traced(self, name=None, category="frame"):
+        """
+        Decorador que mede cada chamada da função.
+
+        A decisão é tomada ao decorar: com o tracer desligado a própria função é devolvida,
+        sem nenhum custo extra por chamada.
+        """
+        def decorator(func):
+            if not self.enabled:
+                return func
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with _Span(self, span_name, category):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def flush(self, path=None):
+        """Grava os spans do buffer como JSON de trace events. Retorna o caminho gravado."""
+        path = path or self.output_path
+        if not path or not self.events:
+            return None
+
+        pid = os.getpid()
+        events = list(self.events)
+        origin = min(event[2] for event in events)
+        trace_events = [
+            {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+             "ts": (start - origin) / 1000, "dur": (end - start) / 1000}
+            for name, category, start, end, tid in events
+        ]
+        for thread in threading.enumerate():
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread.ident, "args": {"name": thread.name}})
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
+        log.info("🧵 Trace gravado em %s (%d spans)", path, len(events))
+        return path
+
+
+tracer = Tracer()  # Instância global
+if os.getenv("TRACE_FILE"):
+    tracer.enable(os.getenv("TRACE_FILE"))
+
+span = tracer.span
+traced = tracer.traced
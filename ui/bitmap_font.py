@@ -1,26 +1,89 @@
 import json
+from collections import OrderedDict
 import pygame
 import sys
 import os
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from scripts.texture_atlas import texture_atlas
+from scripts.asset_cache import surface_bytes
+
 class BitmapFont:
+    TEXT_CACHE_BYTES = 4 * 1024 * 1024  # Memória máxima dos textos já renderizados
+
     def __init__(self, image_path, json_path):
-        """Inicializa a fonte bitmap carregando a imagem e o mapeamento de caracteres."""
-        self.image = pygame.image.load(image_path).convert_alpha()
+        """
+        Inicializa a fonte bitmap carregando a imagem e o mapeamento de caracteres.
 
+        `render` usa dois caches: glifos já escalados e coloridos, por (caractere, cor, tamanho), e um
+        LRU de textos inteiros, por (texto, cor, tamanho), limitado a TEXT_CACHE_BYTES. Um menu
+        estático não refaz nenhum glifo a cada frame.
+        """
         with open(json_path, "r", encoding="utf-8") as file:
             char_data = json.load(file)
 
         # Criar um dicionário para acesso rápido aos caracteres
         self.char_map = {data["name"]: (data["x"], data["y"], data["width"], data["height"]) for data in char_data}
 
+        # Os glifos vêm do atlas compartilhado quando ele existe; senão, da imagem da fonte
+        self.image = None
+        glyphs = texture_atlas.get_frames(image_path, list(self.char_map.values()))
+        if glyphs is None:
+            self.image = pygame.image.load(image_path).convert_alpha()
+            glyphs = [self.image.subsurface(pygame.Rect(rect)) for rect in self.char_map.values()]
+        self.glyphs = dict(zip(self.char_map, glyphs))
+
+        self.glyph_cache = {}  # (caractere, cor, tamanho) -> superfície escalada e colorida
+        self.text_cache = OrderedDict()  # (texto, cor, tamanho) -> superfície, do menos para o mais recente
+        self.text_cache_bytes = 0
+        self.text_hits = 0
+        self.text_misses = 0
+
         char_list = """ !"',-.0123456789:;?ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"""
 
+    def get_glyph(self, char, color, font_size):
+        """Retorna o glifo escalado para `font_size` e colorido com `color`."""
+        key = (char, color, font_size)
+        glyph = self.glyph_cache.get(key)
+        if glyph is None:
+            scale_factor = font_size / 16
+            _, _, char_w, char_h = self.char_map[char]
+            glyph = pygame.transform.scale(self.glyphs[char], (int(char_w * scale_factor), int(char_h * scale_factor)))
+
+            # Ajuste de cor sem alterar a opacidade
+            glyph.fill(color, special_flags=pygame.BLEND_RGBA_MIN)
+            self.glyph_cache[key] = glyph
+        return glyph
+
     def render(self, text, color=(255, 255, 255), font_size=16):
-        """Gera uma superfície com o texto renderizado corretamente e escalado."""
+        """
+        Gera uma superfície com o texto renderizado corretamente e escalado.
+
+        A superfície é compartilhada pelo cache: quem chama deve apenas desenhá-la, sem modificá-la.
+        """
         if not text:
             return pygame.Surface((1, 1), pygame.SRCALPHA)
 
+        if not isinstance(color, (str, tuple)):
+            color = tuple(color)  # Listas e pygame.Color viram chaves hasheáveis
+        key = (text, color, font_size)
+        text_surface = self.text_cache.get(key)
+        if text_surface is not None:
+            self.text_cache.move_to_end(key)
+            self.text_hits += 1
+            return text_surface
+
+        self.text_misses += 1
+        text_surface = self.compose(text, color, font_size)
+        self.text_cache[key] = text_surface
+        self.text_cache_bytes += surface_bytes(text_surface)
+        while self.text_cache_bytes > self.TEXT_CACHE_BYTES and len(self.text_cache) > 1:
+            _, evicted = self.text_cache.popitem(last=False)
+            self.text_cache_bytes -= surface_bytes(evicted)
+        return text_surface
+
+    def compose(self, text, color, font_size):
+        """Monta o texto a partir dos glifos em cache, com uma única chamada a `blits`."""
         scale_factor = font_size / 16  # Como a fonte base tem 16x16, usamos essa proporção
         char_spacing = int(2 * scale_factor)
         num_spaces = text.count(" ")
@@ -34,22 +97,17 @@ class BitmapFont:
         text_surface.fill((0, 0, 0, 0))
 
         x_offset = 0
+        sequence = []
         for char in text:
             if char in self.char_map:
-                char_x, char_y, char_w, char_h = self.char_map[char]
-                char_rect = pygame.Rect(char_x, char_y, char_w, char_h)
-                char_image = self.image.subsurface(char_rect)
-                char_image = pygame.transform.scale(char_image, (int(char_w * scale_factor), int(char_h * scale_factor)))
-
-                # Ajuste de cor sem alterar a opacidade
-                char_image.fill(color, special_flags=pygame.BLEND_RGBA_MIN)
-
-                text_surface.blit(char_image, (x_offset, 0))
+                char_image = self.get_glyph(char, color, font_size)
+                sequence.append((char_image, (x_offset, 0)))
                 x_offset += char_image.get_width() + char_spacing
             elif char == " ":
                 space_width = int(8 * scale_factor)  # Ajustável conforme necessário
                 x_offset += space_width + char_spacing
 
+        text_surface.blits(sequence, doreturn=False)
         return text_surface
 
 
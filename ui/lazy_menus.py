@@ -0,0 +1,38 @@
+import importlib
+
+from scripts.startup_trace import startup
+
+
+class LazyMenus:
+    def __init__(self, specs):
+        """
+        Lista dos menus do jogo que só importa e constrói cada menu no primeiro acesso.
+
+        Os menus continuam acessados por índice (`MENUS[0]` é o principal, `MENUS[1]` as
+        configurações, `MENUS[2]` a seleção de personagem). Assim o primeiro frame só paga pelo
+        menu principal; o módulo e os assets dos outros são carregados quando forem abertos.
+
+        :param specs: [(módulo, classe)] de cada menu, na ordem dos índices.
+        """
+        self.specs = list(specs)
+        self.menus = [None] * len(self.specs)
+
+    def __getitem__(self, index):
+        menu = self.menus[index]
+        if menu is None:
+            module_name, class_name = self.specs[index]
+            with startup.measure(f"{module_name}.{class_name}"):
+                menu_class = getattr(importlib.import_module(module_name), class_name)
+                menu = self.menus[index] = menu_class()
+        return menu
+
+    def __len__(self):
+        return len(self.specs)
+
+    def __iter__(self):
+        """Percorre só os menus já construídos (os outros não podem estar inscritos em nada)."""
+        return (menu for menu in self.menus if menu is not None)
+
+    def built(self):
+        """Menus já construídos."""
+        return list(self)
@@ -1,6 +1,4 @@
 import pygame
-import json
-import yaml
 import sys
 import os
 from random import randint
@@ -9,40 +7,45 @@ from random import randint
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 ROOT_PATH = os.getenv("ROOT_PATH")
-print(f"🔧 ROOT_PATH: {ROOT_PATH}")
+from scripts.tracing import traced
+from ui.widgets import OptionList
+from scripts.settings_store import settings
+from scripts.locale_catalog import locales
+from scripts.game_log import get_logger
 
-from .character_selection_menu import CharacterSelectMenu
-from ui.settings_menu import SettingsMenu
-from assets.scenes.main_scene import MainScene
+log = get_logger(__name__)
+log.debug("🔧 ROOT_PATH: %s", ROOT_PATH)
 
 class MainMenu:
-    SETTINGS = None
     def __init__(self):
         self.load_texts()
-        self.CURRENT_LOCALE = self.SETTINGS["language"]
+        self.CURRENT_LOCALE = settings["language"]
+        settings.subscribe("language", self.on_language_changed)  # Textos refeitos só quando o idioma muda
         self.MENUS = []
         self.open = False
-        self.options = [
-            self.texts["menu"]["start_game"],
-            self.texts["menu"]["settings"],
-            self.texts["menu"]["character_select"],
-            self.texts["menu"]["exit"],
-        ]
         self.selected_option = 0
         self.cooldown_click = 0
-        self.option_positions = []
-        self.font = None
+        self.option_list = OptionList(center=(640, 300), spacing=60, font_size=32)
         self.backgrounds = []
         self.background = []
         self.bg_width = 0
+        self.scroll_speed = 2  # Pixels por passo de simulação
 
-        print("📜 MainMenu carregado!")
+        log.debug("📜 MainMenu carregado!")
 
     def load_texts(self):
-        """Carrega os textos do arquivo YAML."""
-        self.SETTINGS = json.loads(os.environ["SETTINGS"])
-        with open(os.path.join(ROOT_PATH, "locales", f"{self.SETTINGS['language']}.yml"), "r", encoding="utf-8") as file:
-            self.texts = yaml.safe_load(file)
+        """Pega os textos do idioma atual no catálogo compilado."""
+        self.texts = locales.get(settings["language"])
+        self.options = [
+            self.texts["menu.start_game"],
+            self.texts["menu.settings"],
+            self.texts["menu.character_select"],
+            self.texts["menu.exit"],
+        ]
+
+    def on_language_changed(self, key, language):
+        self.load_texts()
+        self.CURRENT_LOCALE = language
     
     def load_and_scale_background(self, image_path, screen):
         """Carrega e reescala o background para que sua altura preencha a tela sem deformação."""
@@ -65,6 +68,7 @@ class MainMenu:
         self.background = [{"image": self.backgrounds[0], "x": 0, "y": 0}]
         self.bg_width = self.backgrounds[0].get_width()
     
+    @traced()
     def update_background(self, screen):
         """Aplica parallax no fundo e adiciona/remova fundos conforme necessário."""
         if len(self.backgrounds) == 0:
@@ -72,7 +76,7 @@ class MainMenu:
         screen_width, _ = screen.get_size()
 
         for bg in self.background:
-            bg["x"] -= 2
+            bg["x"] -= self.scroll_speed
 
         if self.background[-1]["x"] + self.bg_width <= screen_width + 20:
             new_bg = {
@@ -85,28 +89,19 @@ class MainMenu:
         if self.background[0]["x"] + self.bg_width < -50:
             self.background.pop(0)
     
+    @traced()
     def update(self, params):
         """Gerencia entrada do usuário e atualiza a cena."""
         screen = params["screen"]
 
-        self.SETTINGS = json.loads(os.environ["SETTINGS"])
-
         if not self.open:
             self.open = True
-        
-        if self.CURRENT_LOCALE != self.SETTINGS["language"]:
-            self.load_texts()
-            self.CURRENT_LOCALE = self.SETTINGS["language"]
-            self.options = [
-                self.texts["menu"]["start_game"],
-                self.texts["menu"]["settings"],
-                self.texts["menu"]["character_select"],
-                self.texts["menu"]["exit"],
-            ]
 
         if not self.MENUS:
             self.MENUS = params["menus"]
 
+        self.update_background(screen)
+
         if params["key_events"]["key"] == pygame.K_DOWN:
             self.selected_option = (self.selected_option + 1) % len(self.options)
         elif params["key_events"]["key"] == pygame.K_UP:
@@ -118,29 +113,28 @@ class MainMenu:
             self.cooldown_click = 2
             self.select_option(params)
 
-        mouse_x, mouse_y = params["mouse_events"]["pos"]
-        for i, (x, y, w, h) in enumerate(self.option_positions):
-            if x <= mouse_x <= x + w and y <= mouse_y <= y + h:
-                self.selected_option = i
+        hovered = self.option_list.option_at(params["mouse_events"]["pos"])
+        if hovered is not None:
+            self.selected_option = hovered
         
         self.cooldown_click -= 1 if self.cooldown_click > 0 else 0
 
     def select_option(self, params):
         """Executa a ação da opção selecionada."""
         option = self.options[self.selected_option]
-        print(f"🟢 Selecionado: {option}")
+        log.info("🟢 Selecionado: %s", option)
 
-        if option == self.texts["menu"]["start_game"]:
-            print("🚀 Iniciando o jogo...")
+        if option == self.texts["menu.start_game"]:
+            log.info("🚀 Iniciando o jogo...")
             self.open_main_scene(params)
-        elif option == self.texts["menu"]["settings"]:
-            print("⚙️ Abrindo Configurações...")
+        elif option == self.texts["menu.settings"]:
+            log.info("⚙️ Abrindo Configurações...")
             self.open_settings(params["main_update"])
-        elif option == self.texts["menu"]["character_select"]:
-            print("🎭 Abrindo Seleção de Personagem...")
+        elif option == self.texts["menu.character_select"]:
+            log.info("🎭 Abrindo Seleção de Personagem...")
             self.open_character_select(params["main_update"])
-        elif option == self.texts["menu"]["exit"]:
-            print("❌ Saindo do jogo...")
+        elif option == self.texts["menu.exit"]:
+            log.info("❌ Saindo do jogo...")
             self.open = False
             pygame.event.post(pygame.event.Event(pygame.QUIT))
 
@@ -155,30 +149,26 @@ class MainMenu:
 
     def open_main_scene(self, params):
         """Abre a cena principal do jogo."""
-        params["main_update"]({"current_menu": None})
-        params["main_update"]({"current_scene": MainScene(params["screen"])})
+        from assets.scenes.main_scene import MainScene  # Importada só aqui, fora do caminho do primeiro frame
+
+        # Os assets da cena carregam em segundo plano enquanto o fade acontece
+        params["main_update"]({"current_menu": None, "load_scene": MainScene})
     
-    def draw(self, screen):
+    @traced()
+    def draw(self, screen, alpha=1.0):
         """Desenha o menu e o fundo."""
         if not self.open:
             return
 
+        offset = self.scroll_speed * (1 - alpha)  # Interpola o fundo entre o passo anterior e o atual
         for bg in self.background:
-            screen.blit(bg["image"], (bg["x"], bg["y"]))
+            screen.blit(bg["image"], (bg["x"] + offset, bg["y"]))
 
-        if self.font is None:
-            from assets.fonts.title_font import bitmap_font
-            self.font = bitmap_font
-        
-        self.option_positions = []
-        for i, option in enumerate(self.options):
-            color = "yellow" if i == self.selected_option else "white"
-            text_surface = self.font.render(option, color, 32)
-            text_rect = text_surface.get_rect(center=(640, 300 + i * 60))
-            self.option_positions.append((text_rect.x, text_rect.y, text_rect.width, text_rect.height))
-            screen.blit(text_surface, text_rect)
+        # Os textos só são refeitos quando o idioma ou a seleção mudam
+        self.option_list.set_options(self.options)
+        self.option_list.set_selected(self.selected_option)
+        self.option_list.draw(screen)
     
     def late_update(self, params):
         """Método chamado após o update()."""
-        self.update_background(params["screen"])
-        self.draw(params["screen"])
+        self.draw(params["screen"], params.get("alpha", 1.0))
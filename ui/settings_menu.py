@@ -1,52 +1,44 @@
 import pygame
-import yaml
 import sys
 import os
-import json
 
 ROOT_PATH = os.getenv("ROOT_PATH")
-LANG_PATH = os.path.join(ROOT_PATH, "locales")
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from scripts.tracing import traced
+from ui.widgets import OptionList
+from scripts.settings_store import settings
+from scripts.locale_catalog import locales
+from scripts.game_log import get_logger
+
+log = get_logger(__name__)
 
 class SettingsMenu:
+    REPORTS_DAMAGE = True  # Só as opções alteradas são enviadas ao display (veja DisplayDamage)
+
     def __init__(self):
         """Inicializa o menu de configurações."""
         self.main_update = None
         self.MENUS = []
-        self.font = None
         self.options = ["sound", "language", "difficulty", "back"]
         self.background = pygame.image.load(os.path.join(ROOT_PATH, "assets", "sprites", "bar", "settings-background.png"))
         self.selected_option = 0
         self.cooldown_click = 0
         self.open = False
-        self.option_positions = []
-
-        # Carrega as configurações e os textos do idioma
-        self.settings = self.load_settings()
-        self.texts = self.load_language(self.settings["language"])
-
-    def load_settings(self):
-        """Carrega as configurações do ENV ou usa valores padrão."""
-        return json.loads(os.environ["SETTINGS"])
+        self.option_list = OptionList(center=(640, 300), spacing=60, font_size=32)
 
-    def save_settings(self):
-        """Salva as configurações no ENV e informa ao jogo."""
-        os.environ["SETTINGS"] = json.dumps(self.settings)
+        # Carrega os textos do idioma e os recarrega quando ele mudar
+        self.texts = self.load_language(settings["language"])
+        settings.subscribe("language", self.on_language_changed)
 
-        # Recarrega os textos se a linguagem for alterada
-        if self.main_update is not None:
-            self.main_update({"settings": self.settings})
-        self.texts = self.load_language(self.settings["language"])
+    def on_language_changed(self, key, language):
+        self.texts = self.load_language(language)
 
     def load_language(self, language):
-        """Carrega os textos do YAML com base no idioma selecionado."""
-        lang_file = os.path.join(LANG_PATH, f"{language}.yml")
-        print(f"🌐 Carregando idioma: {lang_file}")
-        if os.path.exists(lang_file):
-            with open(lang_file, "r", encoding="utf-8") as file:
-                return yaml.safe_load(file)
-        return {}
+        """Textos do idioma selecionado, do catálogo compilado (sem YAML em tempo de execução)."""
+        log.debug("🌐 Carregando idioma: %s", language)
+        return locales.get(language)
 
+    @traced()
     def update(self, params):
         """Gerencia entrada do usuário para ajustar as configurações."""
         if len(self.MENUS) == 0:
@@ -65,10 +57,9 @@ class SettingsMenu:
             self.select_option()
 
         # Navegação com mouse
-        mouse_x, mouse_y = params["mouse_events"]["pos"]
-        for i, (x, y, w, h) in enumerate(self.option_positions):
-            if x <= mouse_x <= x + w and y <= mouse_y <= y + h:
-                self.selected_option = i
+        hovered = self.option_list.option_at(params["mouse_events"]["pos"])
+        if hovered is not None:
+            self.selected_option = hovered
 
         self.cooldown_click -= 1 if self.cooldown_click > 0 else 0
 
@@ -77,27 +68,21 @@ class SettingsMenu:
         option = self.options[self.selected_option]
 
         if option == "sound":
-            self.settings["sound"] = "off" if self.settings["sound"] == "on" else "on"
+            settings.set("sound", "off" if settings["sound"] == "on" else "on")
         elif option == "language":
-            languages = list(self.texts["languages"].keys())  # Obtém a lista de idiomas disponíveis
-            current_index = languages.index(self.settings["language"])
-            self.settings["language"] = languages[(current_index + 1) % len(languages)]
+            languages = self.texts.keys("languages")  # Obtém a lista de idiomas disponíveis
+            current_index = languages.index(settings["language"])
+            settings.set("language", languages[(current_index + 1) % len(languages)])
         elif option == "difficulty":
-            levels = [self.texts["difficulty"]["easy"], self.texts["difficulty"]["medium"], self.texts["difficulty"]["hard"]]
-            levels_translate = ["easy", "medium", "hard"]
-            current_index = levels_translate.index(self.settings["difficulty"])
-            self.settings["difficulty"] = levels_translate[(current_index + 1) % len(levels)]
+            levels = settings.CHOICES["difficulty"]
+            current_index = levels.index(settings["difficulty"])
+            settings.set("difficulty", levels[(current_index + 1) % len(levels)])
         elif option == "back":
             self.main_update({"current_menu": self.MENUS[0]}) 
 
-        self.save_settings()
-
+    @traced()
     def draw(self, screen):
         """Desenha o menu de configurações."""
-        if self.font is None:
-            from assets.fonts.title_font import bitmap_font
-            self.font = bitmap_font
-
         # check if background size is the same as screen size
         screen_width, screen_height = screen.get_size()
         if self.background.get_height() != screen_height:
@@ -106,24 +91,31 @@ class SettingsMenu:
 
         screen.blit(self.background, (0, 0))
 
-        self.option_positions = []
-        for i, option in enumerate(self.options):
-            color = "yellow" if i == self.selected_option else "white"
+        self.option_list.draw(screen)
 
-            if option in self.settings:
-                value = self.settings[option]
+    def option_texts(self):
+        """Texto de cada opção com o valor atual da configuração."""
+        texts = []
+        for option in self.options:
+            if option in settings:
+                value = settings[option]
                 if option == "difficulty":
-                    value = self.texts["difficulty"].get(value, value)
-                text = f"{self.texts['settings'][option]}: {value}".upper()
+                    value = self.texts.get(f"difficulty.{value}", value)
+                texts.append(f"{self.texts[f'settings.{option}']}: {value}".upper())
             else:
-                text = self.texts["settings"]["back"]
-
-            text_surface = self.font.render(text, color, 32)
-            text_rect = text_surface.get_rect(center=(640, 300 + i * 60))
-            self.option_positions.append((text_rect.x, text_rect.y, text_rect.width, text_rect.height))
-
-            screen.blit(text_surface, text_rect)
+                texts.append(self.texts["settings.back"])
+        return texts
 
     def late_update(self, params):
-        """Método opcional chamado após o update()."""
-        self.draw(params["screen"])
\ No newline at end of file
+        """Desenha o menu; com DisplayDamage, só as opções que mudaram são redesenhadas."""
+        # Os textos só são refeitos quando as configurações, o idioma ou a seleção mudam
+        self.option_list.set_options(self.option_texts())
+        self.option_list.set_selected(self.selected_option)
+
+        screen = params["screen"]
+        damage = params.get("damage")
+        if damage is None or damage.needs_redraw(self):
+            self.option_list.pop_damage()
+            self.draw(screen)
+        else:
+            damage.redraw(screen, self.option_list.pop_damage(), lambda: self.draw(screen))
\ No newline at end of file
@@ -0,0 +1,251 @@
+import pygame
+
+
+def default_font():
+    """Fonte dos menus. Importada só quando necessária, pois exige o display do pygame já criado."""
+    from assets.fonts.title_font import bitmap_font
+    return bitmap_font
+
+
+class Widget:
+    def __init__(self):
+        """
+        Base dos widgets retidos dos menus.
+
+        O widget guarda a superfície renderizada e o retângulo ocupado na tela; ambos só são
+        refeitos quando algo muda (`mark_dirty`). Assim um menu parado apenas repete blits.
+        """
+        self.dirty = True
+        self.surface = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.damage = []  # Retângulos (antigos e novos) alterados desde o último `pop_damage`
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def render(self):
+        """Cria a superfície do widget. As subclasses sobrescrevem; por padrão, uma superfície vazia."""
+        return pygame.Surface((0, 0), pygame.SRCALPHA)
+
+    def layout(self, surface):
+        """Retângulo ocupado pela superfície na tela. As subclasses sobrescrevem; por padrão, no canto (0, 0)."""
+        return surface.get_rect()
+
+    def refresh(self):
+        """Refaz a superfície e o retângulo se o widget estiver sujo."""
+        if self.dirty:
+            self.damage.append(self.rect)
+            self.surface = self.render()
+            self.rect = self.layout(self.surface)
+            self.damage.append(self.rect)
+            self.dirty = False
+
+    def pop_damage(self):
+        """Retorna e limpa as regiões da tela que o widget alterou (veja DisplayDamage)."""
+        self.refresh()
+        damage, self.damage = self.damage, []
+        return damage
+
+    def get_rect(self):
+        self.refresh()
+        return self.rect
+
+    def hit_test(self, pos):
+        """Indica se `pos` está dentro do widget (usa o retângulo em cache)."""
+        return self.get_rect().collidepoint(pos)
+
+    def draw(self, screen):
+        self.refresh()
+        screen.blit(self.surface, self.rect)
+
+
+class Label(Widget):
+    def __init__(self, text, center, color="white", font_size=32, font=None):
+        """
+        Texto de uma linha centralizado em `center`.
+
+        :param text: Texto exibido.
+        :param center: Centro do texto na tela.
+        :param color: Cor do texto.
+        :param font_size: Tamanho da fonte.
+        :param font: BitmapFont usada; por padrão a fonte dos títulos.
+        """
+        super().__init__()
+        self.text = text
+        self.center = center
+        self.color = color
+        self.font_size = font_size
+        self.font = font
+
+    def set_text(self, text):
+        if text != self.text:
+            self.text = text
+            self.mark_dirty()
+
+    def set_color(self, color):
+        if color != self.color:
+            self.color = color
+            self.mark_dirty()
+
+    def set_font_size(self, font_size):
+        if font_size != self.font_size:
+            self.font_size = font_size
+            self.mark_dirty()
+
+    def set_center(self, center):
+        if center != self.center:
+            self.center = center
+            if self.surface is not None and not self.dirty:
+                self.damage.append(self.rect)
+                self.rect = self.layout(self.surface)  # Só o retângulo muda; a superfície continua válida
+                self.damage.append(self.rect)
+
+    def render(self):
+        if self.font is None:
+            self.font = default_font()
+        return self.font.render(self.text, self.color, self.font_size)
+
+    def layout(self, surface):
+        return surface.get_rect(center=self.center)
+
+
+class OptionList(Widget):
+    def __init__(self, center, spacing=60, font_size=32, color="white", selected_color="yellow", font=None):
+        """
+        Lista vertical de opções com uma delas destacada.
+
+        :param center: Centro da primeira opção.
+        :param spacing: Distância vertical entre as opções.
+        :param font_size: Tamanho da fonte.
+        :param color: Cor das opções.
+        :param selected_color: Cor da opção selecionada.
+        :param font: BitmapFont usada; por padrão a fonte dos títulos.
+        """
+        super().__init__()
+        self.center = center
+        self.spacing = spacing
+        self.font_size = font_size
+        self.color = color
+        self.selected_color = selected_color
+        self.font = font
+        self.labels = []
+        self.selected = 0
+
+    def set_options(self, options):
+        """Atualiza os textos; só as opções que mudaram são refeitas."""
+        if len(options) != len(self.labels):
+            self.damage.extend(label.rect for label in self.labels)
+            x, y = self.center
+            self.labels = [
+                Label(text, (x, y + i * self.spacing), self.option_color(i), self.font_size, self.font)
+                for i, text in enumerate(options)
+            ]
+            return
+        for label, text in zip(self.labels, options):
+            label.set_text(text)
+
+    def option_color(self, index):
+        return self.selected_color if index == self.selected else self.color
+
+    def set_selected(self, index):
+        if index != self.selected:
+            self.selected = index
+            for i, label in enumerate(self.labels):
+                label.set_color(self.option_color(i))
+
+    def option_at(self, pos):
+        """Índice da opção sob `pos`, ou None."""
+        for i, label in enumerate(self.labels):
+            if label.hit_test(pos):
+                return i
+        return None
+
+    def rects(self):
+        """Retângulos em cache de cada opção."""
+        return [label.get_rect() for label in self.labels]
+
+    def pop_damage(self):
+        damage, self.damage = self.damage, []
+        for label in self.labels:
+            damage.extend(label.pop_damage())
+        return damage
+
+    def draw(self, screen):
+        for label in self.labels:
+            label.refresh()
+        screen.blits([(label.surface, label.rect) for label in self.labels], doreturn=False)
+
+
+class CharacterCard(Widget):
+    SELECTED_SCALE = 1.8
+    SCALE = 1.6
+
+    def __init__(self, name, sprite_size, animation_handler, font=None):
+        """
+        Cartão da seleção de personagem: nome acima do sprite.
+
+        Fora de foco o cartão mostra o primeiro quadro de "idle", renderizado uma vez. Selecionado,
+        apenas o sprite da animação atual é buscado a cada frame; nome e retângulo seguem em cache.
+
+        :param name: Nome exibido.
+        :param sprite_size: (largura, altura) do personagem em jogo, antes da escala do cartão.
+        :param animation_handler: AnimationHandler com a animação "idle" do personagem.
+        :param font: BitmapFont usada; por padrão a fonte dos títulos.
+        """
+        super().__init__()
+        self.sprite_size = sprite_size
+        self.animation_handler = animation_handler
+        self.position = (0, 0)
+        self.selected = False
+        self.name_label = Label(name, (0, 0), "white", 14, font)
+        self.size = (0, 0)
+        self.offset = (0, 0)
+        self.last_sprite = None  # Último quadro desenhado, para detectar quando a animação avança
+
+    def set_layout(self, position, selected):
+        """Posiciona o cartão; muda de tamanho quando entra ou sai de foco."""
+        if position != self.position or selected != self.selected:
+            self.position = position
+            self.selected = selected
+            self.mark_dirty()
+
+    def current_sprite(self):
+        """(sprite, deslocamento) que o cartão desenha agora."""
+        self.refresh()
+        if self.selected:
+            return self.animation_handler.get_sprite(self.size)
+        return self.surface, self.offset
+
+    def pop_damage(self):
+        self.refresh()
+        damage, self.damage = self.damage, []
+        damage.extend(self.name_label.pop_damage())
+        if self.current_sprite()[0] is not self.last_sprite:
+            damage.append(self.rect)  # A animação avançou: só a área do sprite muda
+        return damage
+
+    def render(self):
+        scale = self.SELECTED_SCALE if self.selected else self.SCALE
+        width, height = self.sprite_size[0] * scale, self.sprite_size[1] * scale
+        self.size = (width, height)
+        x, y = self.position
+        self.name_label.set_font_size(16 if self.selected else 14)
+        self.name_label.set_center((x, y - height // 2 - 20))  # Nome acima do personagem
+        if self.selected:
+            return None  # O sprite animado é buscado a cada frame em `draw`
+        sprite, self.offset = self.animation_handler.get_animation("idle").get_frame_at(0, (width, height), flipped=False)
+        return sprite
+
+    def layout(self, surface):
+        width, height = self.size
+        x, y = self.position
+        return pygame.Rect(x - width // 2, y - height // 2, width, height)
+
+    def draw(self, screen):
+        sprite, offset = self.current_sprite()
+        self.last_sprite = sprite
+        if sprite:
+            width, height = self.size
+            x, y = self.position
+            self.name_label.draw(screen)
+            screen.blit(sprite, (x - int(width) // 2 + offset[0], y - int(height) // 2 + offset[1]))